@@ -5,8 +5,12 @@ Generates human-readable insights from patterns and responses.
 
 from __future__ import annotations
 
+from collections import Counter
 from typing import Optional
 
+from sqlalchemy import case, func
+from sqlalchemy.orm import selectinload
+
 from ktt.core.database import get_session as get_db_session
 from ktt.core.models import User, Pattern, TasteElement, Movie
 
@@ -28,7 +32,7 @@ def generate_profile_insights(user: User) -> list[str]:
         ).order_by(TasteElement.importance_score.desc()).limit(5).all()
 
         # Get movie count
-        movie_count = db.query(Movie).filter(Movie.user_id == user.id).count()
+        movie_count = db.query(func.count(Movie.id)).filter(Movie.user_id == user.id).scalar()
 
     if not patterns and not elements:
         return ["Complete more sessions to discover patterns in your taste."]
@@ -74,13 +78,14 @@ def generate_session_insights(session_id: str) -> list[str]:
         if not session:
             return insights
 
-        responses = db.query(Response).filter(Response.session_id == session_id).all()
-
-        # Calculate stats
-        total_responses = len(responses)
-        high_confidence = len([r for r in responses if r.confidence and r.confidence >= 4])
-        new_insights_count = len([r for r in responses if r.is_new_insight])
-        avg_specificity = sum(r.specificity_score or 0 for r in responses) / total_responses if total_responses else 0
+        # Calculate stats in a single aggregate query
+        total_responses, high_confidence, new_insights_count, specificity_total = db.query(
+            func.count(Response.id),
+            func.count(case((Response.confidence >= 4, 1))),
+            func.count(case((Response.is_new_insight == True, 1))),
+            func.coalesce(func.sum(Response.specificity_score), 0.0),
+        ).filter(Response.session_id == session_id).one()
+        avg_specificity = specificity_total / total_responses if total_responses else 0
 
     if total_responses == 0:
         return ["No responses recorded in this session."]
@@ -106,21 +111,23 @@ def generate_session_insights(session_id: str) -> list[str]:
 
 def compare_movies(user: User, movie_ids: list[str]) -> Optional[str]:
     """Generate a comparison insight between movies."""
-    from ktt.core.models import Movie, Response
+    from ktt.core.models import Movie
     from ktt.core.encryption import decrypt_response
     from ktt.analysis.specificity import extract_specific_elements
 
     with get_db_session() as db:
-        movies = db.query(Movie).filter(Movie.id.in_(movie_ids)).all()
+        # Eager-load responses so every movie's responses arrive in one query
+        movies = db.query(Movie).options(
+            selectinload(Movie.responses)
+        ).filter(Movie.id.in_(movie_ids)).all()
         if len(movies) < 2:
             return None
 
         # Get elements for each movie
         movie_elements = {}
         for movie in movies:
-            responses = db.query(Response).filter(Response.movie_id == movie.id).all()
             elements = set()
-            for r in responses:
+            for r in movie.responses:
                 try:
                     text = decrypt_response(r.response_text)
                     elements.update(extract_specific_elements(text))
@@ -128,21 +135,16 @@ def compare_movies(user: User, movie_ids: list[str]) -> Optional[str]:
                     continue
             movie_elements[movie.title] = elements
 
-    # Find common and unique elements
-    all_elements = set()
-    for elements in movie_elements.values():
-        all_elements.update(elements)
-
-    common = all_elements.copy()
-    for elements in movie_elements.values():
-        common &= elements
+    # Find common elements
+    common = set.intersection(*movie_elements.values())
 
     if common:
         return f"These films share your attention to: {', '.join(list(common)[:3])}"
 
-    # Find distinguishing elements
+    # Find distinguishing elements: those mentioned for exactly one film
+    element_film_counts = Counter(e for elements in movie_elements.values() for e in elements)
     for title, elements in movie_elements.items():
-        unique = elements - set().union(*[e for t, e in movie_elements.items() if t != title])
+        unique = {e for e in elements if element_film_counts[e] == 1}
         if unique:
             return f"{title} uniquely engaged your {list(unique)[0]} sensibilities."
 
@@ -5,15 +5,16 @@ Analyzes responses across movies to detect patterns in the user's taste.
 
 from __future__ import annotations
 
-import re
-from collections import Counter
-from datetime import datetime
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
 from typing import Optional
 
+from sqlalchemy import func
+
 from ktt.core.database import get_session as get_db_session
-from ktt.core.models import User, Movie, Response, Pattern, TasteElement
+from ktt.core.models import User, Movie, Response, Pattern, TasteElement, utcnow
 from ktt.core.encryption import decrypt_response, encrypt_json
-from ktt.analysis.specificity import extract_specific_elements
+from ktt.analysis.specificity import WORD_REGEX, extract_specific_elements
 from ktt.cli.ui import console, print_info
 
 # Minimum movies needed for pattern detection
@@ -22,78 +23,139 @@ MIN_MOVIES_FOR_PATTERNS = 3
 # Minimum confidence threshold for storing a pattern
 MIN_PATTERN_CONFIDENCE = 0.4
 
+# Responses fetched per round trip while streaming pattern detection input
+RESPONSE_BATCH_SIZE = 500
+
+# Re-run detection after a session once this many responses are new...
+PATTERN_REFRESH_RESPONSES = 10
+
+# ...or once this long has passed since the last run, if any are new at all
+PATTERN_REFRESH_INTERVAL = timedelta(hours=24)
+
+# Description template for each pattern type
+PATTERN_TEMPLATES = {
+    "thematic": "You consistently respond to themes of {}",
+    "visual": "You pay close attention to {} elements",
+    "auditory": "Sound and music ({}) significantly impact your experience",
+    "structural": "You notice and value {} in storytelling",
+    "performance": "Strong {} is a key factor in your enjoyment",
+    "general": "You frequently mention {} in your responses",
+}
+
+# Pattern type for non-thematic elements (anything else is "general")
+ELEMENT_PATTERN_TYPES = {
+    "visual": "visual",
+    "color": "visual",
+    "lighting": "visual",
+    "audio": "auditory",
+    "score": "auditory",
+    "sound": "auditory",
+    "editing": "structural",
+    "pacing": "structural",
+    "performance": "performance",
+    "acting": "performance",
+}
+
+# Taste element type for non-thematic elements (anything else is "general")
+TASTE_ELEMENT_TYPES = {
+    "visual": "visual",
+    "color": "visual",
+    "lighting": "visual",
+    "framing": "visual",
+    "audio": "auditory",
+    "score": "auditory",
+    "sound": "auditory",
+}
+
+# Repeated concepts worth surfacing as patterns: (trigger words, description)
+CONCEPT_PATTERNS = [
+    (("intimate", "intimacy"), "You value intimate, close moments in films"),
+    (("quiet", "silence", "stillness"), "Quiet, still moments resonate with you"),
+    (("unexpected", "surprise", "surprising"), "You appreciate the unexpected"),
+    (("authentic", "real", "genuine"), "Authenticity matters deeply to you"),
+    (("beautiful", "beauty"), "Visual beauty captures your attention"),
+    (("tension", "tense", "suspense"), "You engage with tension and suspense"),
+    (("subtle", "subtlety", "understated"), "You appreciate subtlety over obviousness"),
+]
+
+# Trigger word -> description, so one walk over the text counts every concept
+CONCEPT_KEYWORDS = {
+    word: description
+    for words, description in CONCEPT_PATTERNS
+    for word in words
+}
+
 
 def detect_patterns(user: User) -> list[Pattern]:
     """Detect patterns in user's responses and store them."""
+    started_at = utcnow()
+
     with get_db_session() as db:
         # Get all movies with responses
         movies = db.query(Movie).filter(Movie.user_id == user.id).all()
         if len(movies) < MIN_MOVIES_FOR_PATTERNS:
             return []
 
-        # Get all responses
-        all_responses = []
-        for movie in movies:
-            responses = db.query(Response).filter(Response.movie_id == movie.id).all()
-            for r in responses:
-                try:
-                    text = decrypt_response(r.response_text)
-                    all_responses.append({
-                        "movie_id": movie.id,
-                        "movie_title": movie.title,
-                        "question_key": r.question_key,
-                        "text": text,
-                        "confidence": r.confidence,
-                    })
-                except Exception:
-                    continue
-
-        if not all_responses:
-            return []
-
-        # Extract elements from all responses
+        # Stream responses in batches and fold each into the element counts as
+        # it arrives, so memory stays flat however many responses there are.
+        # Mentions are counted in bulk per response, and movie coverage is
+        # built from each movie's distinct elements rather than every mention.
+        rows = db.query(
+            Response.movie_id, Response.response_text, Response.confidence
+        ).join(
+            Movie, Response.movie_id == Movie.id
+        ).filter(Movie.user_id == user.id).yield_per(RESPONSE_BATCH_SIZE)
+
+        response_count = 0
         element_counts = Counter()
-        element_movies = {}  # element -> list of movie_ids
+        elements_by_movie = defaultdict(set)  # movie_id -> set of elements
+        high_confidence_responses = []  # Analyzed separately for insights
+
+        for movie_id, response_text, confidence in rows:
+            try:
+                text = decrypt_response(response_text)
+            except Exception:
+                continue
+
+            response_count += 1
+            elements = extract_specific_elements(text)
+            element_counts.update(elements)
+            elements_by_movie[movie_id].update(elements)
+            if confidence and confidence >= 4:
+                high_confidence_responses.append({"movie_id": movie_id, "text": text})
+
+        if not response_count:
+            return []
 
-        for resp in all_responses:
-            elements = extract_specific_elements(resp["text"])
+        element_movies = defaultdict(set)  # element -> set of movie_ids
+        for movie_id, elements in elements_by_movie.items():
             for elem in elements:
-                element_counts[elem] += 1
-                if elem not in element_movies:
-                    element_movies[elem] = set()
-                element_movies[elem].add(resp["movie_id"])
+                element_movies[elem].add(movie_id)
 
         # Find patterns (elements appearing in multiple movies)
         detected_patterns = []
         total_movies = len(movies)
+        mention_scale = response_count * 0.5
 
         for element, count in element_counts.most_common(20):
-            movie_ids = list(element_movies[element])
-            movie_coverage = len(movie_ids) / total_movies
+            movie_count = len(element_movies[element])
+            if movie_count < 2:
+                continue  # A pattern needs support from at least two films
 
             # Calculate confidence based on coverage and mention count
-            confidence = min(0.95, movie_coverage * 0.7 + (count / (len(all_responses) * 0.5)) * 0.3)
+            movie_coverage = movie_count / total_movies
+            confidence = min(0.95, movie_coverage * 0.7 + (count / mention_scale) * 0.3)
 
-            if confidence >= MIN_PATTERN_CONFIDENCE and len(movie_ids) >= 2:
+            if confidence >= MIN_PATTERN_CONFIDENCE:
+                movie_ids = list(element_movies[element])
                 # Determine pattern type
                 if element.startswith("theme:"):
                     pattern_type = "thematic"
-                    description = f"You consistently respond to themes of {element.replace('theme:', '')}"
-                elif element in ["visual", "color", "lighting"]:
-                    pattern_type = "visual"
-                    description = f"You pay close attention to {element} elements"
-                elif element in ["audio", "score", "sound"]:
-                    pattern_type = "auditory"
-                    description = f"Sound and music ({element}) significantly impact your experience"
-                elif element in ["editing", "pacing"]:
-                    pattern_type = "structural"
-                    description = f"You notice and value {element} in storytelling"
-                elif element in ["performance", "acting"]:
-                    pattern_type = "performance"
-                    description = f"Strong {element} is a key factor in your enjoyment"
+                    subject = element.replace("theme:", "")
                 else:
-                    pattern_type = "general"
-                    description = f"You frequently mention {element} in your responses"
+                    pattern_type = ELEMENT_PATTERN_TYPES.get(element, "general")
+                    subject = element
+                description = PATTERN_TEMPLATES[pattern_type].format(subject)
 
                 detected_patterns.append({
                     "type": pattern_type,
@@ -103,28 +165,27 @@ def detect_patterns(user: User) -> list[Pattern]:
                     "element": element,
                 })
 
-        # Also analyze high-confidence responses for insights
-        high_confidence_responses = [r for r in all_responses if r.get("confidence", 0) and r["confidence"] >= 4]
-
-        # Look for repeated phrases or concepts
+        # Also look for repeated phrases or concepts in high-confidence responses
         phrase_patterns = extract_phrase_patterns(high_confidence_responses)
         detected_patterns.extend(phrase_patterns)
 
-        # Store patterns in database
+        # Store patterns in database, matching against all existing patterns
+        # fetched in one query
+        existing_patterns = {
+            (pattern.pattern_type, pattern.description): pattern
+            for pattern in db.query(Pattern).filter(Pattern.user_id == user.id)
+        }
+        new_patterns = []
         stored_patterns = []
         for p in detected_patterns:
             # Check if similar pattern exists
-            existing = db.query(Pattern).filter(
-                Pattern.user_id == user.id,
-                Pattern.pattern_type == p["type"],
-                Pattern.description == p["description"],
-            ).first()
+            existing = existing_patterns.get((p["type"], p["description"]))
 
             if existing:
                 # Update confidence and supporting movies
                 existing.confidence = max(existing.confidence, p["confidence"])
                 existing.supporting_movie_ids = list(set(existing.supporting_movie_ids or []) | set(p["movie_ids"]))
-                existing.last_confirmed = datetime.utcnow()
+                existing.last_confirmed = started_at
                 stored_patterns.append(existing)
             else:
                 # Create new pattern
@@ -135,9 +196,15 @@ def detect_patterns(user: User) -> list[Pattern]:
                     confidence=p["confidence"],
                     supporting_movie_ids=p["movie_ids"],
                 )
-                db.add(pattern)
+                existing_patterns[(p["type"], p["description"])] = pattern
+                new_patterns.append(pattern)
                 stored_patterns.append(pattern)
 
+        db.add_all(new_patterns)
+
+        # Remember when this run started for patterns_need_refresh()
+        db_user = db.query(User).filter(User.id == user.id).first()
+        db_user.settings = {**(db_user.settings or {}), "last_pattern_detection": started_at.isoformat()}
         db.commit()
 
         # Update taste elements
@@ -146,40 +213,54 @@ def detect_patterns(user: User) -> list[Pattern]:
         return stored_patterns
 
 
+def patterns_need_refresh(user: User) -> bool:
+    """Check whether enough has changed since the last detection run to re-run it."""
+    with get_db_session() as db:
+        settings = db.query(User.settings).filter(User.id == user.id).scalar() or {}
+        last_run = settings.get("last_pattern_detection")
+        if last_run is None:
+            return True
+
+        last_run = datetime.fromisoformat(last_run)
+        new_responses = db.query(func.count(Response.id)).join(
+            Movie, Response.movie_id == Movie.id
+        ).filter(
+            Movie.user_id == user.id,
+            Response.created_at >= last_run,
+        ).scalar()
+
+    if new_responses >= PATTERN_REFRESH_RESPONSES:
+        return True
+    return new_responses > 0 and utcnow() - last_run >= PATTERN_REFRESH_INTERVAL
+
+
 def extract_phrase_patterns(responses: list[dict]) -> list[dict]:
     """Extract repeated phrases or concepts from responses."""
     patterns = []
 
-    # Combine all response text
-    all_text = " ".join(r["text"].lower() for r in responses)
+    # Count each concept's mentions and the movies they appear in, in a
+    # single pass over the responses
+    concept_counts = Counter()  # description -> mention count
+    concept_movies = defaultdict(set)  # description -> set of movie_ids
+    for r in responses:
+        for word in WORD_REGEX.findall(r["text"].lower()):
+            description = CONCEPT_KEYWORDS.get(word)
+            if description:
+                concept_counts[description] += 1
+                concept_movies[description].add(r["movie_id"])
 
     # Look for repeated meaningful phrases (simple approach)
-    concept_patterns = [
-        (r"\b(intimate|intimacy)\b", "You value intimate, close moments in films"),
-        (r"\b(quiet|silence|stillness)\b", "Quiet, still moments resonate with you"),
-        (r"\b(unexpected|surprise|surprising)\b", "You appreciate the unexpected"),
-        (r"\b(authentic|real|genuine)\b", "Authenticity matters deeply to you"),
-        (r"\b(beautiful|beauty)\b", "Visual beauty captures your attention"),
-        (r"\b(tension|tense|suspense)\b", "You engage with tension and suspense"),
-        (r"\b(subtle|subtlety|understated)\b", "You appreciate subtlety over obviousness"),
-    ]
-
-    for pattern, description in concept_patterns:
-        matches = re.findall(pattern, all_text)
-        if len(matches) >= 3:
-            # Find which movies these appear in
-            movie_ids = set()
-            for r in responses:
-                if re.search(pattern, r["text"].lower()):
-                    movie_ids.add(r["movie_id"])
-
+    for words, description in CONCEPT_PATTERNS:
+        matches = concept_counts[description]
+        if matches >= 3:
+            movie_ids = concept_movies[description]
             if len(movie_ids) >= 2:
                 patterns.append({
                     "type": "conceptual",
                     "description": description,
-                    "confidence": min(0.9, len(matches) / 10 + len(movie_ids) / len(responses)),
+                    "confidence": min(0.9, matches / 10 + len(movie_ids) / len(responses)),
                     "movie_ids": list(movie_ids),
-                    "element": pattern,
+                    "element": "|".join(words),
                 })
 
     return patterns
@@ -187,19 +268,19 @@ def extract_phrase_patterns(responses: list[dict]) -> list[dict]:
 
 def update_taste_elements(user: User, element_counts: Counter, element_movies: dict, db) -> None:
     """Update the taste elements based on detected patterns."""
+    existing_elements = {
+        element.element_name: element
+        for element in db.query(TasteElement).filter(TasteElement.user_id == user.id)
+    }
+    new_elements = []
+
     for element, count in element_counts.most_common(30):
         # Parse element type
         if element.startswith("theme:"):
             elem_type = "thematic"
             elem_name = element.replace("theme:", "")
-        elif element in ["visual", "color", "lighting", "framing"]:
-            elem_type = "visual"
-            elem_name = element
-        elif element in ["audio", "score", "sound"]:
-            elem_type = "auditory"
-            elem_name = element
         else:
-            elem_type = "general"
+            elem_type = TASTE_ELEMENT_TYPES.get(element, "general")
             elem_name = element
 
         # Calculate importance score
@@ -207,10 +288,7 @@ def update_taste_elements(user: User, element_counts: Counter, element_movies: d
         importance = min(1.0, count * 0.1 + movie_count * 0.15)
 
         # Update or create taste element
-        existing = db.query(TasteElement).filter(
-            TasteElement.user_id == user.id,
-            TasteElement.element_name == elem_name,
-        ).first()
+        existing = existing_elements.get(elem_name)
 
         if existing:
             existing.mention_count = count
@@ -223,7 +301,10 @@ def update_taste_elements(user: User, element_counts: Counter, element_movies: d
                 importance_score=importance,
                 mention_count=count,
             )
-            db.add(element_record)
+            existing_elements[elem_name] = element_record
+            new_elements.append(element_record)
+
+    db.add_all(new_elements)
 
 
 def get_user_patterns(user: User) -> list[Pattern]:
@@ -243,10 +324,8 @@ def get_taste_summary(user: User) -> dict:
         ).order_by(TasteElement.importance_score.desc()).limit(10).all()
 
         # Group patterns by type
-        patterns_by_type = {}
+        patterns_by_type = defaultdict(list)
         for p in patterns:
-            if p.pattern_type not in patterns_by_type:
-                patterns_by_type[p.pattern_type] = []
             patterns_by_type[p.pattern_type].append({
                 "description": p.description,
                 "confidence": p.confidence,
@@ -254,7 +333,7 @@ def get_taste_summary(user: User) -> dict:
             })
 
         return {
-            "patterns": patterns_by_type,
+            "patterns": dict(patterns_by_type),
             "top_elements": [
                 {"name": e.element_name, "type": e.element_type, "importance": e.importance_score}
                 for e in elements
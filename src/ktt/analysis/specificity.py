@@ -3,9 +3,93 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 
+# Specificity indicators: (trigger words, pattern, score delta). Single-word
+# indicators are looked up in the response's word set; anything that needs
+# phrase or context matching is a regex. Either one firing applies the delta.
+SPECIFICITY_INDICATORS = [
+    # Positive indicators (increase score)
+    (None, r"\bwhen\b.*\b(was|were|did)\b", 0.08),  # Temporal specificity
+    (None, r"\bthe scene where\b|\bin the scene\b", 0.12),  # Scene reference
+    ({"specifically", "exactly", "precisely"}, None, 0.08),
+    (None, r"\bi remember\b|\bi recall\b", 0.08),  # Memory marker
+    (None, r"\bthe moment\b|\bthat moment\b", 0.1),  # Moment reference
+    (None, r'"[^"]{5,}?"', 0.12),  # Quoted dialogue (min 5 chars)
+    (None, r"'[^']{5,}?'", 0.1),  # Single-quoted text
+    (None, r"\bfirst\b.*\bthen\b|\bafter\b.*\bbefore\b", 0.08),  # Sequence
+    ({"face", "eyes", "hands", "voice", "expression"}, None, 0.08),  # Body/performance
+    ({"shot", "frame", "cut", "angle", "camera"}, None, 0.1),  # Technical terms
+    ({"lighting", "color", "shadow", "contrast"}, None, 0.08),  # Visual terms
+    ({"score", "soundtrack", "music", "sound", "silence"}, None, 0.06),  # Audio terms
+    ({"because"}, None, 0.06),  # Causal reasoning
+    (None, r"\bfor example\b|\bfor instance\b", 0.1),  # Examples
+    (None, r"\b(felt|feeling|emotion)\b.*\b(when|during|as)\b", 0.08),  # Emotional specificity
+    # Negative indicators (decrease score)
+    (None, r"\bkind of\b|\bsort of\b", -0.08),  # Hedging
+    ({"maybe", "probably"}, r"\bi guess\b", -0.08),  # Uncertainty
+    ({"overall", "mostly"}, r"\bin general\b", -0.1),  # Generalization
+    (None, r"\bjust\b.*\breally\b|\breally\b.*\bjust\b", -0.08),  # Filler
+    ({"good", "great"}, r"\bnice\b(?! [a-z]+ because)", -0.06),  # Generic praise
+    (None, r"\binteresting\b(?! because)(?! in that)", -0.06),  # Vague positive
+    (None, r"\bi don't know\b|\bi'm not sure\b", -0.1),  # Explicit uncertainty
+]
+
+SCORE_INDICATORS = [
+    (
+        frozenset(words) if words else None,
+        re.compile(pattern, re.IGNORECASE) if pattern else None,
+        delta,
+    )
+    for words, pattern, delta in SPECIFICITY_INDICATORS
+]
+
+WORD_REGEX = re.compile(r"\w+")
+
+# Specific elements: (trigger words, phrase pattern, element)
+ELEMENT_INDICATORS = [
+    # Technical elements
+    ({"cinematography", "lighting", "framing", "composition"}, None, "visual"),
+    ({"score", "soundtrack", "music"}, r"\bsound design\b", "audio"),
+    ({"editing", "cut", "cuts", "pacing", "rhythm"}, None, "editing"),
+    ({"dialogue", "script", "writing"}, None, "writing"),
+    ({"performance", "acting", "delivery"}, None, "performance"),
+    ({"color", "palette", "tone"}, None, "color"),
+    # Thematic elements (simplified extraction)
+    ({"loss", "grief", "mourning"}, None, "theme:loss"),
+    ({"love", "romance", "relationship"}, None, "theme:love"),
+    ({"isolation", "loneliness", "alone"}, None, "theme:isolation"),
+    ({"hope", "redemption", "healing"}, None, "theme:hope"),
+    ({"nostalgia", "memory", "past"}, None, "theme:nostalgia"),
+    ({"identity", "self"}, r"\bwho I am\b", "theme:identity"),
+    ({"family", "parent", "child"}, None, "theme:family"),
+    ({"mortality", "death", "dying"}, None, "theme:mortality"),
+]
+
+# Every trigger word maps straight to its element, so one walk over the
+# response's words finds all of them
+ELEMENT_KEYWORDS = {
+    word: element
+    for words, _, element in ELEMENT_INDICATORS
+    for word in words or ()
+}
+
+ELEMENT_PHRASES = [
+    (re.compile(pattern, re.IGNORECASE), element)
+    for _, pattern, element in ELEMENT_INDICATORS
+    if pattern
+]
+
+SENTENCE_SPLIT = re.compile(r'[.!?]+')
+
+# Word-count thresholds for the length adjustment
+MIN_SCORED_WORDS = 5
+SHORT_RESPONSE_WORDS = 10
+LONG_RESPONSE_WORDS = 50
+
+
 def calculate_specificity_score(response: str) -> float:
     """
     Calculate a specificity score for a response (0-1).
@@ -17,55 +101,27 @@ def calculate_specificity_score(response: str) -> float:
 
     score = 0.5  # Start at neutral
 
-    # Length factors
-    word_count = len(response.split())
-    if word_count < 10:
+    # Length factors (only need to know if there are fewer than 10 or more
+    # than 50 words, so stop splitting after that)
+    word_count = len(response.split(maxsplit=LONG_RESPONSE_WORDS))
+    if word_count < MIN_SCORED_WORDS:
+        # Too short for indicators to be meaningful: skip the scans and score
+        # it as a short response. A few-word answer that would have earned a
+        # bonus (e.g. "I remember her face") scores slightly lower as a result.
+        return score - 0.2
+    if word_count < SHORT_RESPONSE_WORDS:
         score -= 0.2
-    elif word_count > 50:
+    elif word_count > LONG_RESPONSE_WORDS:
         score += 0.1
-    elif word_count > 100:
-        score += 0.15
 
-    # Positive indicators (increase score)
-    positive_patterns = [
-        (r"\bwhen\b.*\b(was|were|did)\b", 0.08),  # Temporal specificity
-        (r"\bthe scene where\b|\bin the scene\b", 0.12),  # Scene reference
-        (r"\bspecifically\b|\bexactly\b|\bprecisely\b", 0.08),
-        (r"\bi remember\b|\bi recall\b", 0.08),  # Memory marker
-        (r"\bthe moment\b|\bthat moment\b", 0.1),  # Moment reference
-        (r'"[^"]{5,}?"', 0.12),  # Quoted dialogue (min 5 chars)
-        (r"'[^']{5,}?'", 0.1),  # Single-quoted text
-        (r"\bfirst\b.*\bthen\b|\bafter\b.*\bbefore\b", 0.08),  # Sequence
-        (r"\b(face|eyes|hands|voice|expression)\b", 0.08),  # Body/performance
-        (r"\b(shot|frame|cut|angle|camera)\b", 0.1),  # Technical terms
-        (r"\b(lighting|color|shadow|contrast)\b", 0.08),  # Visual terms
-        (r"\b(score|soundtrack|music|sound|silence)\b", 0.06),  # Audio terms
-        (r"\bbecause\b", 0.06),  # Causal reasoning
-        (r"\bfor example\b|\bfor instance\b", 0.1),  # Examples
-        (r"\b(felt|feeling|emotion)\b.*\b(when|during|as)\b", 0.08),  # Emotional specificity
-    ]
-
-    for pattern, bonus in positive_patterns:
-        if re.search(pattern, response, re.IGNORECASE):
-            score += bonus
-
-    # Negative indicators (decrease score)
-    negative_patterns = [
-        (r"\bkind of\b|\bsort of\b", -0.08),  # Hedging
-        (r"\bi guess\b|\bmaybe\b|\bprobably\b", -0.08),  # Uncertainty
-        (r"\bin general\b|\boverall\b|\bmostly\b", -0.1),  # Generalization
-        (r"\bjust\b.*\breally\b|\breally\b.*\bjust\b", -0.08),  # Filler
-        (r"\bgood\b|\bgreat\b|\bnice\b(?! [a-z]+ because)", -0.06),  # Generic praise
-        (r"\binteresting\b(?! because)(?! in that)", -0.06),  # Vague positive
-        (r"\bi don't know\b|\bi'm not sure\b", -0.1),  # Explicit uncertainty
-    ]
-
-    for pattern, penalty in negative_patterns:
-        if re.search(pattern, response, re.IGNORECASE):
-            score += penalty
+    # Tokenize once; word indicators become set lookups
+    words = set(WORD_REGEX.findall(response.lower()))
+    for triggers, regex, delta in SCORE_INDICATORS:
+        if (triggers and not words.isdisjoint(triggers)) or (regex and regex.search(response)):
+            score += delta
 
     # Sentence variety bonus
-    sentences = re.split(r'[.!?]+', response)
+    sentences = SENTENCE_SPLIT.split(response)
     sentences = [s.strip() for s in sentences if s.strip()]
     if len(sentences) >= 3:
         score += 0.05
@@ -74,41 +130,17 @@ def calculate_specificity_score(response: str) -> float:
     return max(0.0, min(1.0, score))
 
 
-def extract_specific_elements(response: str) -> list[str]:
-    """Extract specific elements mentioned in a response."""
-    elements = []
+@lru_cache(maxsize=8192)
+def extract_specific_elements(response: str) -> frozenset[str]:
+    """Extract specific elements mentioned in a response (memoized per text)."""
+    words = set(WORD_REGEX.findall(response.lower()))
+    elements = {ELEMENT_KEYWORDS[word] for word in words.intersection(ELEMENT_KEYWORDS)}
 
-    # Technical elements
-    technical_patterns = [
-        (r"\b(cinematography|lighting|framing|composition)\b", "visual"),
-        (r"\b(score|soundtrack|music|sound design)\b", "audio"),
-        (r"\b(editing|cuts?|pacing|rhythm)\b", "editing"),
-        (r"\b(dialogue|script|writing)\b", "writing"),
-        (r"\b(performance|acting|delivery)\b", "performance"),
-        (r"\b(color|palette|tone)\b", "color"),
-    ]
-
-    for pattern, category in technical_patterns:
-        if re.search(pattern, response, re.IGNORECASE):
-            elements.append(category)
+    for regex, element in ELEMENT_PHRASES:
+        if element not in elements and regex.search(response):
+            elements.add(element)
 
-    # Thematic elements (simplified extraction)
-    thematic_patterns = [
-        (r"\b(loss|grief|mourning)\b", "loss"),
-        (r"\b(love|romance|relationship)\b", "love"),
-        (r"\b(isolation|loneliness|alone)\b", "isolation"),
-        (r"\b(hope|redemption|healing)\b", "hope"),
-        (r"\b(nostalgia|memory|past)\b", "nostalgia"),
-        (r"\b(identity|self|who I am)\b", "identity"),
-        (r"\b(family|parent|child)\b", "family"),
-        (r"\b(mortality|death|dying)\b", "mortality"),
-    ]
-
-    for pattern, theme in thematic_patterns:
-        if re.search(pattern, response, re.IGNORECASE):
-            elements.append(f"theme:{theme}")
-
-    return list(set(elements))
+    return frozenset(elements)
 
 
 def get_specificity_feedback(score: float) -> Optional[str]:
@@ -1,20 +1,18 @@
 """Main CLI entry point for Know Thy Taste."""
 
+import sys
+
+# Answer version queries before importing Typer and Rich
+if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version"):
+    from ktt import __version__
+
+    print(f"ktt {__version__}")
+    sys.exit(0)
+
 import typer
 from typing import Optional
 from pathlib import Path
 
-from ktt.cli.ui import (
-    console,
-    print_welcome,
-    print_success,
-    print_error,
-    print_info,
-    print_warning,
-    print_header,
-    create_movie_table,
-)
-
 app = typer.Typer(
     name="ktt",
     help="Know Thy Taste - Discover why you love the movies you love.",
@@ -27,19 +25,27 @@ movies_app = typer.Typer(help="Manage your movie collection")
 patterns_app = typer.Typer(help="View and validate detected patterns")
 privacy_app = typer.Typer(help="Privacy controls and data management")
 
-app.add_typer(session_app, name="session")
-app.add_typer(movies_app, name="movies")
-app.add_typer(patterns_app, name="patterns")
-app.add_typer(privacy_app, name="privacy")
+SUB_APPS = {
+    "session": session_app,
+    "movies": movies_app,
+    "patterns": patterns_app,
+    "privacy": privacy_app,
+}
+
+# Only wire up the group being invoked; help and other commands get all of them
+_invoked = sys.argv[1] if len(sys.argv) > 1 else None
+for _name, _sub_app in SUB_APPS.items():
+    if _invoked not in SUB_APPS or _invoked == _name:
+        app.add_typer(_sub_app, name=_name)
 
 
 @app.command()
 def init() -> None:
     """Initialize Know Thy Taste for first-time use."""
-    from ktt.core.database import get_data_dir, init_db, get_session as get_db_session
-    from ktt.privacy.consent import run_initial_consent, apply_pending_consent
+    from ktt.core.database import get_data_dir, init_db
+    from ktt.privacy.consent import run_initial_consent, take_pending_consent
     from ktt.core.auth import setup_passphrase
-    from ktt.core.models import User
+    from ktt.cli.ui import print_welcome, print_success, print_error, print_info, print_header
 
     print_welcome()
     print_header("First-Time Setup")
@@ -61,18 +67,12 @@ def init() -> None:
         print_error("Setup cancelled. You must accept the privacy policy to continue.")
         raise typer.Exit(1)
 
-    # Setup passphrase (this creates the user and initializes the DB)
-    passphrase = setup_passphrase()
+    # Setup passphrase (this creates the user, with their consent choices)
+    passphrase = setup_passphrase(take_pending_consent())
     if not passphrase:
         print_error("Setup cancelled.")
         raise typer.Exit(1)
 
-    # Apply pending consent to the user
-    with get_db_session() as db:
-        user = db.query(User).first()
-        if user:
-            apply_pending_consent(user.id)
-
     print_success("Know Thy Taste is ready!")
     print_info("Run 'ktt session start' to begin your first discovery session.")
 
@@ -83,21 +83,32 @@ def profile() -> None:
     from ktt.core.auth import require_auth
     from ktt.core.database import get_session as get_db_session
     from ktt.core.models import Movie, Pattern, Response
+    from sqlalchemy import func, select
     from rich.panel import Panel
     from rich import box
+    from ktt.cli.ui import console, print_info, print_header
 
     user = require_auth()
     if not user:
         raise typer.Exit(1)
 
     with get_db_session() as db:
-        movie_count = db.query(Movie).filter(Movie.user_id == user.id).count()
-        response_count = db.query(Response).join(Movie).filter(Movie.user_id == user.id).count()
-        pattern_count = db.query(Pattern).filter(Pattern.user_id == user.id).count()
-        validated_patterns = db.query(Pattern).filter(
-            Pattern.user_id == user.id,
-            Pattern.validated_by_user == True
-        ).count()
+        # All four counts come back from a single SELECT
+        movie_count, response_count, pattern_count, validated_patterns = db.query(
+            select(func.count(Movie.id))
+            .where(Movie.user_id == user.id)
+            .scalar_subquery(),
+            select(func.count(Response.id))
+            .join(Movie)
+            .where(Movie.user_id == user.id)
+            .scalar_subquery(),
+            select(func.count(Pattern.id))
+            .where(Pattern.user_id == user.id)
+            .scalar_subquery(),
+            select(func.count(Pattern.id))
+            .where(Pattern.user_id == user.id, Pattern.validated_by_user == True)
+            .scalar_subquery(),
+        ).one()
 
     print_header("Your Taste Profile")
 
@@ -124,6 +135,7 @@ def export(
     """Export your data."""
     from ktt.core.auth import require_auth
     from ktt.privacy.export import export_data
+    from ktt.cli.ui import print_success, print_error
 
     user = require_auth()
     if not user:
@@ -190,13 +202,17 @@ def movies_list() -> None:
     from ktt.core.auth import require_auth
     from ktt.core.database import get_session as get_db_session
     from ktt.core.models import Movie
+    from ktt.cli.ui import console, print_info, create_movie_table
 
     user = require_auth()
     if not user:
         raise typer.Exit(1)
 
     with get_db_session() as db:
-        movies = db.query(Movie).filter(Movie.user_id == user.id).all()
+        # Only the columns the table shows
+        movies = db.query(
+            Movie.title, Movie.year, Movie.last_analyzed, Movie.created_at
+        ).filter(Movie.user_id == user.id).all()
 
         if not movies:
             print_info("No movies yet. Run 'ktt movies add' to add your first movie.")
@@ -204,12 +220,12 @@ def movies_list() -> None:
 
         movie_data = [
             {
-                "title": m.title,
-                "year": m.year,
-                "analyzed": m.last_analyzed is not None,
-                "created_at": m.created_at.isoformat() if m.created_at else None,
+                "title": title,
+                "year": year,
+                "analyzed": last_analyzed is not None,
+                "created_at": created_at,
             }
-            for m in movies
+            for title, year, last_analyzed, created_at in movies
         ]
 
     table = create_movie_table(movie_data)
@@ -223,7 +239,7 @@ def patterns_show() -> None:
     from ktt.core.auth import require_auth
     from ktt.core.database import get_session as get_db_session
     from ktt.core.models import Pattern, Movie
-    from ktt.cli.ui import print_pattern
+    from ktt.cli.ui import console, print_info, print_header, print_pattern
 
     user = require_auth()
     if not user:
@@ -232,17 +248,27 @@ def patterns_show() -> None:
     print_header("Detected Patterns")
 
     with get_db_session() as db:
-        patterns = db.query(Pattern).filter(Pattern.user_id == user.id).all()
+        patterns = db.query(Pattern).filter(
+            Pattern.user_id == user.id
+        ).order_by(Pattern.first_detected).all()
 
         if not patterns:
             print_info("No patterns detected yet. Complete more sessions to find patterns.")
             return
 
+        # Look up every supporting movie title in one query
+        all_ids = {mid for p in patterns for mid in (p.supporting_movie_ids or [])}
+        movie_rows = db.query(Movie.id, Movie.title).filter(
+            Movie.id.in_(all_ids)
+        ).order_by(Movie.created_at)
+        movies_by_id = {mid: (i, title) for i, (mid, title) in enumerate(movie_rows)}
+
         for p in patterns:
-            # Get supporting movie titles
-            movie_ids = p.supporting_movie_ids or []
-            movies = db.query(Movie).filter(Movie.id.in_(movie_ids)).all()
-            movie_titles = [m.title for m in movies]
+            # Get supporting movie titles, in collection order
+            found = sorted(
+                movies_by_id[mid] for mid in set(p.supporting_movie_ids or []) if mid in movies_by_id
+            )
+            movie_titles = [title for _, title in found]
 
             print_pattern(
                 p.pattern_type,
@@ -261,6 +287,7 @@ def patterns_validate(
     from ktt.core.auth import require_auth
     from ktt.core.database import get_session as get_db_session
     from ktt.core.models import Pattern
+    from ktt.cli.ui import console, print_success, print_error, print_info
 
     user = require_auth()
     if not user:
@@ -322,6 +349,7 @@ def privacy_withdraw(
 def privacy_delete_all() -> None:
     """Delete all your data permanently."""
     from ktt.privacy.deletion import delete_all_data
+    from ktt.cli.ui import print_success, print_info, print_warning
 
     print_warning("This will permanently delete ALL your data.")
     print_warning("This action cannot be undone.")
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import Optional
 
 import questionary
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session as DbSession
 from rich.console import Console
 from rich.panel import Panel
 from rich import box
 
 from ktt.core.database import get_session as get_db_session
-from ktt.core.models import User, Movie, Session, Response
+from ktt.core.models import User, Movie, Session, Response, utcnow
 from ktt.core.encryption import encrypt_response
 from ktt.questions.bank import Question, format_question, get_questions_for_phase
 from ktt.questions.scaffolds import (
@@ -21,6 +24,7 @@ from ktt.questions.scaffolds import (
     get_sentence_starters,
 )
 from ktt.questions.followups import (
+    VagueAnalysis,
     analyze_response,
     get_follow_up_for_attempt,
     should_accept_response,
@@ -46,7 +50,6 @@ from ktt.cli.ui import (
     print_metacognitive_prompt,
     print_phase_header,
 )
-from ktt.privacy.consent import has_consent
 
 SESSION_TYPES = {
     "deep-dive": "Intensive analysis of 1-2 films",
@@ -54,17 +57,36 @@ SESSION_TYPES = {
     "temporal": "Compare your reaction to a rewatched film vs. first viewing",
 }
 
+# Static menus, built once
+SESSION_TYPE_CHOICES = [
+    questionary.Choice(f"{name}: {desc}", value=name)
+    for name, desc in SESSION_TYPES.items()
+]
+
+WATCH_CONTEXT_CHOICES = [
+    questionary.Choice("Theater", value="theater"),
+    questionary.Choice("Home (streaming/disc)", value="home"),
+    questionary.Choice("Flight / Travel", value="travel"),
+    questionary.Choice("Other", value="other"),
+]
+
+CONFIDENCE_CHOICES = [
+    *[questionary.Choice(f"{level}: {desc}", value=level) for level, desc in CONFIDENCE_SCALE.items()],
+    questionary.Choice("Skip rating", value=None),
+]
+
+# Movie menus longer than this switch from a select list to type-to-filter
+AUTOCOMPLETE_THRESHOLD = 30
+
+# Fixed entries around the movie list when selecting films
+NEW_MOVIE_CHOICE = questionary.Choice("+ Add a new movie", value="__new__")
+DONE_SELECTING_CHOICE = questionary.Choice("Done selecting", value="__done__")
+
 
 def run_session(user: User, session_type: Optional[str] = None) -> None:
     """Run a discovery session."""
     # Count existing sessions for scaffolding level
-    with get_db_session() as db:
-        session_count = db.query(Session).filter(
-            Session.user_id == user.id,
-            Session.status == "completed"
-        ).count()
-
-    scaffold = get_scaffold_level(session_count)
+    scaffold = get_scaffold_level(count_completed_sessions(user))
 
     # Select session type if not provided
     if session_type is None:
@@ -95,24 +117,47 @@ def run_session(user: User, session_type: Optional[str] = None) -> None:
         db.commit()
         session_id = session.id
 
-    # Run the questioning flow
+    run_session_flow(user, session_id, movies, scaffold.level)
+
+
+def count_completed_sessions(user: User) -> int:
+    """Count the user's completed sessions (drives the scaffolding level)."""
+    with get_db_session() as db:
+        return db.query(Session).filter(
+            Session.user_id == user.id,
+            Session.status == "completed"
+        ).count()
+
+
+def run_session_flow(
+    user: User,
+    session_id: str,
+    movies: list[Movie],
+    scaffold_level: int,
+    answered: Optional[set[tuple[str, str]]] = None,
+) -> None:
+    """Question the user about each movie, then complete or pause the session."""
     try:
-        run_questioning_flow(user, session_id, movies, scaffold.level)
+        run_questioning_flow(user, session_id, movies, scaffold_level, answered)
 
         # Mark session complete
         with get_db_session() as db:
             session = db.query(Session).filter(Session.id == session_id).first()
             session.status = "completed"
-            session.end_time = datetime.utcnow()
+            session.end_time = utcnow()
             db.commit()
 
         # Session wrap-up
         show_session_summary(session_id)
 
-        # Run pattern detection if consented
+        # Run pattern detection if consented and there is enough new material
+        from ktt.privacy.consent import has_consent
+
         if has_consent(user, "enable_pattern_analysis"):
-            from ktt.analysis.patterns import detect_patterns
-            detect_patterns(user)
+            from ktt.analysis.patterns import detect_patterns, patterns_need_refresh
+
+            if patterns_need_refresh(user):
+                detect_patterns(user)
 
     except KeyboardInterrupt:
         print_warning("\nSession paused. Use 'ktt session resume' to continue.")
@@ -124,14 +169,9 @@ def run_session(user: User, session_type: Optional[str] = None) -> None:
 
 def select_session_type() -> Optional[str]:
     """Interactive session type selection."""
-    choices = [
-        questionary.Choice(f"{name}: {desc}", value=name)
-        for name, desc in SESSION_TYPES.items()
-    ]
-
     return questionary.select(
         "What kind of session would you like?",
-        choices=choices,
+        choices=SESSION_TYPE_CHOICES,
     ).ask()
 
 
@@ -187,21 +227,19 @@ def select_movies_for_session(user: User, session_type: str) -> list[Movie]:
     console.print(f"\n[bold]Select {count_hint} to analyze:[/bold]")
 
     selected_ids = []
+    selected = set()
 
     while len(selected_ids) < max_count:
         # Option to add new movie
-        choices = [
-            questionary.Choice("+ Add a new movie", value="__new__"),
-            *[c for c in movie_choices if c.value not in selected_ids],
-        ]
+        choices = [NEW_MOVIE_CHOICE, *[c for c in movie_choices if c.value not in selected]]
 
         if selected_ids:
-            choices.append(questionary.Choice("Done selecting", value="__done__"))
+            choices.append(DONE_SELECTING_CHOICE)
 
-        selection = questionary.select(
+        selection = choose_movie(
             f"Select movie ({len(selected_ids) + 1}/{max_count}):",
-            choices=choices,
-        ).ask()
+            choices,
+        )
 
         if selection is None:
             return []
@@ -211,6 +249,7 @@ def select_movies_for_session(user: User, session_type: str) -> list[Movie]:
             new_movie = add_movie_interactive(user)
             if new_movie:
                 selected_ids.append(new_movie.id)
+                selected.add(new_movie.id)
                 movie_choices.append(
                     questionary.Choice(
                         f"{new_movie.title} ({new_movie.year})" if new_movie.year else new_movie.title,
@@ -219,6 +258,7 @@ def select_movies_for_session(user: User, session_type: str) -> list[Movie]:
                 )
         else:
             selected_ids.append(selection)
+            selected.add(selection)
 
     # Return movie objects
     with get_db_session() as db:
@@ -229,6 +269,29 @@ def select_movies_for_session(user: User, session_type: str) -> list[Movie]:
         return movies
 
 
+def choose_movie(message: str, choices: list[questionary.Choice]) -> Optional[str]:
+    """Pick one movie choice, filtering by typed text when the list is long."""
+    if len(choices) <= AUTOCOMPLETE_THRESHOLD:
+        return questionary.select(message, choices=choices).ask()
+
+    # Number repeated titles (remakes, re-adds) so every movie stays selectable
+    values_by_title = {}
+    for choice in choices:
+        title, n = choice.title, 1
+        while title in values_by_title:
+            n += 1
+            title = f"{choice.title} [{n}]"
+        values_by_title[title] = choice.value
+
+    title = questionary.autocomplete(
+        message,
+        choices=list(values_by_title),
+        match_middle=True,
+        validate=lambda t: t in values_by_title or "Choose one of the listed movies",
+    ).ask()
+    return None if title is None else values_by_title[title]
+
+
 def add_movie_interactive(user: User) -> Optional[Movie]:
     """Interactively add a new movie."""
     print_header("Add a Movie")
@@ -254,7 +317,7 @@ def add_movie_interactive(user: User) -> Optional[Movie]:
     genres = []
 
     try:
-        from ktt.integrations.tmdb import search_movie, get_movie_details
+        from ktt.integrations.tmdb import search_movie, enrich_movies
 
         results = search_movie(title, year)
         if results:
@@ -277,9 +340,12 @@ def add_movie_interactive(user: User) -> Optional[Movie]:
                 tmdb_id = selected["id"]
                 title = selected["title"]
                 year = selected["year"]
-                details = get_movie_details(tmdb_id)
+                # Fetch details and credits concurrently rather than one after the other
+                details = asyncio.run(enrich_movies([tmdb_id])).get(tmdb_id)
                 if details:
                     genres = details.get("genres", [])
+                    if details.get("director"):
+                        console.print(f"[dim]Directed by {details['director']}[/dim]")
 
     except ImportError:
         pass  # TMDB not configured
@@ -289,12 +355,7 @@ def add_movie_interactive(user: User) -> Optional[Movie]:
     # Watch context
     context = questionary.select(
         "Where did you watch it?",
-        choices=[
-            questionary.Choice("Theater", value="theater"),
-            questionary.Choice("Home (streaming/disc)", value="home"),
-            questionary.Choice("Flight / Travel", value="travel"),
-            questionary.Choice("Other", value="other"),
-        ],
+        choices=WATCH_CONTEXT_CHOICES,
     ).ask()
 
     # Create movie
@@ -316,8 +377,17 @@ def add_movie_interactive(user: User) -> Optional[Movie]:
     return movie
 
 
-def run_questioning_flow(user: User, session_id: str, movies: list[Movie], scaffold_level: int) -> None:
-    """Run the main questioning flow for a session."""
+def run_questioning_flow(
+    user: User,
+    session_id: str,
+    movies: list[Movie],
+    scaffold_level: int,
+    answered: Optional[set[tuple[str, str]]] = None,
+) -> None:
+    """Run the main questioning flow for a session.
+
+    Questions whose (movie_id, question_key) pair is in ``answered`` are skipped.
+    """
     scaffold = get_scaffold_level(scaffold_level - 1)  # Convert level to count-based
     sequencer = QuestionSequencer("deep-dive", scaffold)
 
@@ -325,59 +395,84 @@ def run_questioning_flow(user: User, session_id: str, movies: list[Movie], scaff
     current_phase = None
     used_prompts = []
 
-    for movie in movies:
-        console.print(f"\n[bold cyan]── Analyzing: {movie.title} ──[/bold cyan]\n")
-
-        for question in questions:
-            # Show phase header if changed
-            if question.phase != current_phase:
-                if current_phase:
-                    # Show transition prompt
-                    transition = get_phase_transition_prompt(current_phase, question.phase)
-                    if transition:
-                        print_metacognitive_prompt(transition.text)
-
-                current_phase = question.phase
-                phase_info = get_phase_description(current_phase)
-                print_phase_header(phase_info["name"], phase_info["description"])
-
-            # Occasionally show metacognitive prompt before question
-            if sequencer.should_show_hint() and len(used_prompts) < 3:
-                prompt = get_random_prompt("before_question", used_prompts)
-                if prompt and question.phase == "monitoring":
-                    print_metacognitive_prompt(prompt.text)
-                    used_prompts.append(prompt.key)
-
-            # Ask the question
-            response_text, confidence, is_new = ask_question(
-                question,
-                movie.title,
-                sequencer,
-            )
+    # One database session for the whole flow; answers are inserted and
+    # committed together once per movie
+    with get_db_session() as db:
+        pending_rows: list[dict] = []
+        try:
+            for movie in movies:
+                console.print(f"\n[bold cyan]── Analyzing: {movie.title} ──[/bold cyan]\n")
+
+                for question in questions:
+                    if answered and (movie.id, question.key) in answered:
+                        continue
+
+                    # Show phase header if changed
+                    if question.phase != current_phase:
+                        if current_phase:
+                            # Show transition prompt
+                            transition = get_phase_transition_prompt(current_phase, question.phase)
+                            if transition:
+                                print_metacognitive_prompt(transition.text)
+
+                        current_phase = question.phase
+                        phase_info = get_phase_description(current_phase)
+                        print_phase_header(phase_info["name"], phase_info["description"])
+
+                    # Occasionally show metacognitive prompt before question
+                    if sequencer.should_show_hint() and len(used_prompts) < 3:
+                        prompt = get_random_prompt("before_question", used_prompts)
+                        if prompt and question.phase == "monitoring":
+                            print_metacognitive_prompt(prompt.text)
+                            used_prompts.append(prompt.key)
+
+                    # Ask the question
+                    response_text, confidence, is_new, analysis = ask_question(
+                        question,
+                        movie.title,
+                        sequencer,
+                    )
 
-            if response_text is None:
-                # User skipped or cancelled
-                continue
-
-            # Save response
-            save_response(
-                session_id=session_id,
-                movie_id=movie.id,
-                question=question,
-                response_text=response_text,
-                confidence=confidence,
-                is_new_insight=is_new,
-            )
+                    if response_text is None:
+                        # User skipped or cancelled
+                        continue
+
+                    # Queue response for this movie's insert
+                    pending_rows.append(build_response_row(
+                        session_id=session_id,
+                        movie_id=movie.id,
+                        question=question,
+                        response_text=response_text,
+                        confidence=confidence,
+                        is_new_insight=is_new,
+                        analysis=analysis,
+                    ))
+
+                insert_responses(db, pending_rows)
+                pending_rows = []
+
+                # Update movie's last_analyzed (UPDATE only, no SELECT first)
+                db.query(Movie).filter(Movie.id == movie.id).update(
+                    {Movie.last_analyzed: utcnow()}, synchronize_session=False
+                )
+                db.commit()
 
-        # Update movie's last_analyzed
-        with get_db_session() as db:
-            db_movie = db.query(Movie).filter(Movie.id == movie.id).first()
-            db_movie.last_analyzed = datetime.utcnow()
+        except KeyboardInterrupt:
+            # Keep answers already given for the movie in progress
+            insert_responses(db, pending_rows)
             db.commit()
+            raise
 
-
-def ask_question(question: Question, movie_title: str, sequencer: QuestionSequencer) -> tuple[Optional[str], Optional[int], bool]:
-    """Ask a single question and handle follow-ups. Returns (response, confidence, is_new_insight)."""
+def ask_question(
+    question: Question,
+    movie_title: str,
+    sequencer: QuestionSequencer,
+) -> tuple[Optional[str], Optional[int], bool, Optional[VagueAnalysis]]:
+    """Ask a single question and handle follow-ups.
+
+    Returns (response, confidence, is_new_insight, analysis); analysis is None
+    when responses are not validated at this scaffolding level.
+    """
     formatted = format_question(question, movie_title)
 
     # Show question with optional hint
@@ -403,6 +498,7 @@ def ask_question(question: Question, movie_title: str, sequencer: QuestionSequen
     # Get response with follow-up loop
     attempt = 0
     response_text = None
+    analysis = None
 
     while attempt <= MAX_FOLLOW_UP_ATTEMPTS:
         response = questionary.text(
@@ -412,11 +508,11 @@ def ask_question(question: Question, movie_title: str, sequencer: QuestionSequen
 
         if response is None:
             # User cancelled
-            return None, None, False
+            return None, None, False, None
 
         if response.strip().lower() in ["skip", "pass", "s"]:
             print_info("Skipping this question.")
-            return None, None, False
+            return None, None, False, None
 
         response_text = response.strip()
 
@@ -442,15 +538,9 @@ def ask_question(question: Question, movie_title: str, sequencer: QuestionSequen
     # Ask for confidence rating
     confidence = None
     if response_text:
-        confidence_choices = [
-            questionary.Choice(f"{level}: {desc}", value=level)
-            for level, desc in CONFIDENCE_SCALE.items()
-        ]
-        confidence_choices.append(questionary.Choice("Skip rating", value=None))
-
         confidence = questionary.select(
             "How confident are you in this response?",
-            choices=confidence_choices,
+            choices=CONFIDENCE_CHOICES,
         ).ask()
 
     # Ask if this is a new insight
@@ -463,33 +553,38 @@ def ask_question(question: Question, movie_title: str, sequencer: QuestionSequen
                 default=False,
             ).ask() or False
 
-    return response_text, confidence, is_new
+    return response_text, confidence, is_new, analysis
 
 
-def save_response(
+def build_response_row(
     session_id: str,
     movie_id: str,
     question: Question,
     response_text: str,
     confidence: Optional[int],
     is_new_insight: bool,
-) -> None:
-    """Save a response to the database."""
-    analysis = analyze_response(response_text)
+    analysis: Optional[VagueAnalysis] = None,
+) -> dict:
+    """Build the column values for a response row, encrypting the text."""
+    if analysis is None:
+        analysis = analyze_response(response_text)
+
+    return {
+        "session_id": session_id,
+        "movie_id": movie_id,
+        "question_key": question.key,
+        "question_text": question.text,
+        "response_text": encrypt_response(response_text),
+        "confidence": confidence,
+        "is_new_insight": is_new_insight,
+        "specificity_score": analysis.specificity_score,
+    }
 
-    with get_db_session() as db:
-        response = Response(
-            session_id=session_id,
-            movie_id=movie_id,
-            question_key=question.key,
-            question_text=question.text,
-            response_text=encrypt_response(response_text),
-            confidence=confidence,
-            is_new_insight=is_new_insight,
-            specificity_score=analysis.specificity_score,
-        )
-        db.add(response)
-        db.commit()
+
+def insert_responses(db: DbSession, rows: list[dict]) -> None:
+    """Insert response rows in one statement, bypassing ORM object tracking."""
+    if rows:
+        db.execute(insert(Response), rows)
 
 
 def show_session_summary(session_id: str) -> None:
@@ -497,20 +592,21 @@ def show_session_summary(session_id: str) -> None:
     print_header("Session Complete")
 
     with get_db_session() as db:
-        session = db.query(Session).filter(Session.id == session_id).first()
-        response_count = db.query(Response).filter(Response.session_id == session_id).count()
-
-        # Calculate average specificity
-        responses = db.query(Response).filter(Response.session_id == session_id).all()
-        if responses:
-            avg_specificity = sum(r.specificity_score or 0 for r in responses) / len(responses)
-        else:
-            avg_specificity = 0
+        # Count and average in SQL rather than loading every response
+        start_time, end_time, response_count, avg_specificity = db.query(
+            Session.start_time,
+            Session.end_time,
+            func.count(Response.id),
+            func.avg(func.coalesce(Response.specificity_score, 0.0)),
+        ).outerjoin(Response, Response.session_id == Session.id).filter(
+            Session.id == session_id
+        ).group_by(Session.id).one()
+        avg_specificity = avg_specificity or 0
 
     console.print(Panel(
         f"[cyan]Reflections captured:[/cyan] {response_count}\n"
         f"[cyan]Average specificity:[/cyan] {avg_specificity:.0%}\n"
-        f"[cyan]Duration:[/cyan] {format_duration(session.start_time, session.end_time or datetime.utcnow())}",
+        f"[cyan]Duration:[/cyan] {format_duration(start_time, end_time or utcnow())}",
         title="Summary",
         box=box.ROUNDED,
     ))
@@ -565,16 +661,19 @@ def resume_session(user: User) -> None:
             return
 
         session = db.query(Session).filter(Session.id == session_id).first()
+        session.status = "active"
         movies = db.query(Movie).filter(Movie.id.in_(session.movie_ids)).all()
+        # Detach from session
+        for m in movies:
+            db.expunge(m)
 
         # Get already answered questions
-        answered = db.query(Response.question_key).filter(
+        answered = set(db.query(Response.movie_id, Response.question_key).filter(
             Response.session_id == session_id
-        ).all()
-        answered_keys = {r[0] for r in answered}
+        ))
+        db.commit()
 
-    print_info(f"Resuming session. {len(answered_keys)} questions already answered.")
+    print_info(f"Resuming session. {len(answered)} questions already answered.")
 
-    # Continue the session (simplified - would need more sophisticated tracking)
-    session.status = "active"
-    run_session(user, session.session_type)
+    scaffold = get_scaffold_level(count_completed_sessions(user))
+    run_session_flow(user, session_id, movies, scaffold.level, answered)
@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.markdown import Markdown
 from rich import box
 
+if TYPE_CHECKING:
+    from rich.progress import Progress
+    from rich.table import Table
+
 console = Console()
 
+# Built once; printing a Text skips markup parsing and highlighting
+_WELCOME_BANNER = Text("""
+╭─────────────────────────────────────────╮
+│         KNOW THY TASTE                  │
+│   Discover why you love what you love   │
+╰─────────────────────────────────────────╯
+    """, style="bold cyan")
+
+# Pulls the displayed fields out of each movie dict in one call
+_movie_row_fields = itemgetter("title", "year", "analyzed", "created_at")
+
 
 def print_header(text: str) -> None:
     """Print a styled header."""
@@ -22,13 +37,7 @@ def print_header(text: str) -> None:
 
 def print_welcome() -> None:
     """Print the welcome banner."""
-    banner = """
-╭─────────────────────────────────────────╮
-│         KNOW THY TASTE                  │
-│   Discover why you love what you love   │
-╰─────────────────────────────────────────╯
-    """
-    console.print(banner, style="bold cyan")
+    console.print(_WELCOME_BANNER)
 
 
 def print_success(message: str) -> None:
@@ -99,18 +108,20 @@ def print_pattern(pattern_type: str, description: str, confidence: float, movies
 
 def create_movie_table(movies: list[dict]) -> Table:
     """Create a table of movies."""
+    from rich.table import Table
+
     table = Table(box=box.SIMPLE)
     table.add_column("Title", style="cyan")
     table.add_column("Year", style="dim")
     table.add_column("Analyzed", style="green")
     table.add_column("Added", style="dim")
 
-    for movie in movies:
+    for title, year, analyzed, created_at in map(_movie_row_fields, movies):
         table.add_row(
-            movie.get("title", ""),
-            str(movie.get("year", "")),
-            "✓" if movie.get("analyzed") else "",
-            movie.get("created_at", "")[:10] if movie.get("created_at") else "",
+            title or "",
+            str(year) if year is not None else "",
+            "✓" if analyzed else "",
+            created_at.strftime("%Y-%m-%d") if created_at else "",
         )
 
     return table
@@ -118,6 +129,8 @@ def create_movie_table(movies: list[dict]) -> Table:
 
 def create_progress() -> Progress:
     """Create a progress indicator for long operations."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
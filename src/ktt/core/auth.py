@@ -1,15 +1,15 @@
 """Authentication and passphrase management for Know Thy Taste."""
 
 import hashlib
+import hmac
 import os
 from typing import Optional
 
-import questionary
 from rich.console import Console
 
 from ktt.core.database import get_session, is_initialized, connect_db
-from ktt.core.models import User
-from ktt.core.encryption import derive_key, generate_salt, set_encryption_key
+from ktt.core.models import User, utcnow
+from ktt.core.encryption import derive_key, generate_salt, set_encryption_key, get_encryption_key
 from ktt.cli.ui import print_error, print_success, print_info, print_warning
 
 console = Console()
@@ -17,9 +17,12 @@ console = Console()
 # Minimum passphrase requirements
 MIN_PASSPHRASE_LENGTH = 12
 
+# User authenticated earlier in this process (reused while the key is set)
+_authenticated_user: Optional[User] = None
+
 
 def hash_passphrase(passphrase: str, salt: bytes) -> bytes:
-    """Create a hash of the passphrase for verification (separate from encryption key)."""
+    """Create the legacy verification hash (a second PBKDF2 run, separate from the key)."""
     # Use a different salt derivation for the verification hash
     verification_salt = hashlib.sha256(salt + b"verification").digest()
     return hashlib.pbkdf2_hmac(
@@ -30,14 +33,33 @@ def hash_passphrase(passphrase: str, salt: bytes) -> bytes:
     )
 
 
+def passphrase_tag(key: bytes) -> bytes:
+    """Create the stored verification tag from a derived encryption key."""
+    return hmac.new(key, b"verification", hashlib.sha256).digest()
+
+
+def unlock_key(passphrase: str, user: User) -> Optional[bytes]:
+    """Derive the user's encryption key, or return None if the passphrase is wrong.
+
+    Needs a single PBKDF2 run; accounts still holding a legacy verification
+    hash pay for a second run until they next log in.
+    """
+    key = derive_key(passphrase, user.encryption_salt)
+    if hmac.compare_digest(passphrase_tag(key), user.password_hash):
+        return key
+    if hmac.compare_digest(hash_passphrase(passphrase, user.encryption_salt), user.password_hash):
+        return key
+    return None
+
+
 def validate_passphrase_strength(passphrase: str) -> tuple[bool, str]:
     """Validate passphrase meets minimum requirements."""
     if len(passphrase) < MIN_PASSPHRASE_LENGTH:
         return False, f"Passphrase must be at least {MIN_PASSPHRASE_LENGTH} characters."
 
     # Check for variety (at least some mix)
-    has_letter = any(c.isalpha() for c in passphrase)
-    has_number = any(c.isdigit() for c in passphrase)
+    has_letter = any(map(str.isalpha, passphrase))
+    has_number = any(map(str.isdigit, passphrase))
 
     if not (has_letter and has_number):
         return False, "Passphrase should contain both letters and numbers."
@@ -45,8 +67,15 @@ def validate_passphrase_strength(passphrase: str) -> tuple[bool, str]:
     return True, ""
 
 
-def setup_passphrase() -> Optional[str]:
-    """Interactive passphrase setup for new users."""
+def setup_passphrase(consent_flags: Optional[dict] = None) -> Optional[str]:
+    """Interactive passphrase setup for new users.
+
+    Consent choices made before setup are stored with the new user in the
+    same transaction.
+    """
+    import questionary
+    from ktt.privacy.consent import forget_consent_flags
+
     console.print("\n[bold]Set up your passphrase[/bold]")
     console.print("[dim]This passphrase encrypts your reflections. Choose something memorable.[/dim]")
     console.print(f"[dim]Minimum {MIN_PASSPHRASE_LENGTH} characters, with letters and numbers.[/dim]\n")
@@ -77,20 +106,24 @@ def setup_passphrase() -> Optional[str]:
 
         # Generate salt and create user
         salt = generate_salt()
-        password_hash = hash_passphrase(passphrase, salt)
+        encryption_key = derive_key(passphrase, salt)
 
         with get_session() as db:
             user = User(
-                password_hash=password_hash,
+                password_hash=passphrase_tag(encryption_key),
                 encryption_salt=salt,
-                consent_flags={},
+                consent_flags=consent_flags or {},
                 settings={},
+                last_privacy_review=utcnow() if consent_flags else None,
             )
             db.add(user)
             db.commit()
+            user_id = user.id
+
+        # A fresh user never has cached flags, but keep the cache honest
+        forget_consent_flags(user_id)
 
         # Set up encryption key for this session
-        encryption_key = derive_key(passphrase, salt)
         set_encryption_key(encryption_key)
 
         print_success("Passphrase set successfully.")
@@ -99,12 +132,13 @@ def setup_passphrase() -> Optional[str]:
 
 def verify_passphrase(passphrase: str, user: User) -> bool:
     """Verify a passphrase against stored hash."""
-    expected_hash = hash_passphrase(passphrase, user.encryption_salt)
-    return expected_hash == user.password_hash
+    return unlock_key(passphrase, user) is not None
 
 
 def authenticate() -> Optional[User]:
     """Authenticate the user and set up encryption key."""
+    import questionary
+
     if not is_initialized():
         print_error("Know Thy Taste is not initialized. Run 'ktt init' first.")
         return None
@@ -125,21 +159,22 @@ def authenticate() -> Optional[User]:
         if passphrase is None:
             return None
 
-        if not verify_passphrase(passphrase, user):
+        encryption_key = unlock_key(passphrase, user)
+        if encryption_key is None:
             print_error("Incorrect passphrase.")
             return None
 
+        # Replace a legacy verification hash now that the passphrase is known
+        tag = passphrase_tag(encryption_key)
+        if user.password_hash != tag:
+            user.password_hash = tag
+
         # Set up encryption key
-        encryption_key = derive_key(passphrase, user.encryption_salt)
         set_encryption_key(encryption_key)
 
-        # Refresh the user object to keep it attached
-        user_id = user.id
-
-    # Get a fresh user object
-    with get_session() as db:
-        user = db.query(User).filter(User.id == user_id).first()
-        # Detach from session so it can be used elsewhere
+        # Write any hash upgrade, then detach before the commit expires the
+        # loaded attributes so the user can be used elsewhere
+        db.flush()
         db.expunge(user)
 
     return user
@@ -147,11 +182,16 @@ def authenticate() -> Optional[User]:
 
 def require_auth() -> Optional[User]:
     """Require authentication, returning the user or None if failed."""
-    return authenticate()
+    global _authenticated_user
+    if _authenticated_user is None or get_encryption_key() is None:
+        _authenticated_user = authenticate()
+    return _authenticated_user
 
 
 def change_passphrase(user: User) -> bool:
     """Change the user's passphrase."""
+    import questionary
+
     print_info("Changing passphrase requires re-encrypting all data.")
 
     # Verify current passphrase
@@ -189,16 +229,15 @@ def change_passphrase(user: User) -> bool:
     # TODO: Implement re-encryption of all encrypted fields
 
     new_salt = generate_salt()
-    new_hash = hash_passphrase(new_passphrase, new_salt)
+    new_key = derive_key(new_passphrase, new_salt)
 
     with get_session() as db:
         db_user = db.query(User).filter(User.id == user.id).first()
-        db_user.password_hash = new_hash
+        db_user.password_hash = passphrase_tag(new_key)
         db_user.encryption_salt = new_salt
         db.commit()
 
     # Update encryption key
-    new_key = derive_key(new_passphrase, new_salt)
     set_encryption_key(new_key)
 
     print_success("Passphrase changed successfully.")
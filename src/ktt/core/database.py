@@ -3,9 +3,11 @@
 import os
 from pathlib import Path
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from ktt.core.models import Base
@@ -13,9 +15,19 @@ from ktt.core.models import Base
 _engine = None
 _SessionLocal = None
 
+# Applied to every new SQLite connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",  # Commits append to a log instead of rewriting a journal
+    "PRAGMA synchronous=NORMAL",  # Safe with WAL; skips an fsync per commit
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16384",  # 16 MB page cache
+    "PRAGMA mmap_size=268435456",  # Read pages via a 256 MB memory map
+)
 
+
+@lru_cache(maxsize=1)
 def get_data_dir() -> Path:
-    """Get the data directory for Know Thy Taste."""
+    """Get the data directory for Know Thy Taste, created on first call."""
     # Use XDG_DATA_HOME on Linux, or app-specific location
     if os.name == "nt":  # Windows
         base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
@@ -37,14 +49,25 @@ def get_db_path() -> Path:
     return get_data_dir() / "ktt.db"
 
 
+def create_db_engine(db_path: Path) -> Engine:
+    """Create the SQLite engine, tuning each connection for the local workload."""
+    engine = create_engine(f"sqlite:///{db_path}", echo=False)
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return engine
+
+
 def init_db(passphrase: str) -> None:
     """Initialize the database with the given passphrase."""
     global _engine, _SessionLocal
 
-    db_path = get_db_path()
-    db_url = f"sqlite:///{db_path}"
-
-    _engine = create_engine(db_url, echo=False)
+    _engine = create_db_engine(get_db_path())
     _SessionLocal = sessionmaker(bind=_engine)
 
     # Create all tables
@@ -58,12 +81,15 @@ def connect_db() -> bool:
     """Connect to an existing database. Returns True if successful."""
     global _engine, _SessionLocal
 
+    # Already connected (or just initialized) in this process
+    if _engine is not None:
+        return True
+
     db_path = get_db_path()
     if not db_path.exists():
         return False
 
-    db_url = f"sqlite:///{db_path}"
-    _engine = create_engine(db_url, echo=False)
+    _engine = create_db_engine(db_path)
     _SessionLocal = sessionmaker(bind=_engine)
     return True
 
@@ -106,6 +132,12 @@ def delete_database() -> None:
     if db_path.exists():
         db_path.unlink()
 
+    # WAL mode keeps a log and shared-memory index next to the database
+    for suffix in ("-wal", "-shm"):
+        sidecar = db_path.with_name(db_path.name + suffix)
+        if sidecar.exists():
+            sidecar.unlink()
+
     init_marker = data_dir / ".initialized"
     if init_marker.exists():
         init_marker.unlink()
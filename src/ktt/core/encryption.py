@@ -5,14 +5,31 @@ from __future__ import annotations
 import os
 import base64
 import json
+import zlib
+from functools import lru_cache
 from typing import Any
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 # Module-level encryption key (set after authentication)
 _encryption_key: bytes | None = None
+_cipher: AESGCM | None = None
+_legacy_fernet: Fernet | None = None  # Reads data written before AES-GCM
+
+# Leading byte of AES-GCM payloads (older Fernet tokens always start with b"g")
+AESGCM_VERSION = b"\x01"
+# Leading byte of AES-GCM payloads whose plaintext was zlib-compressed first
+AESGCM_ZLIB_VERSION = b"\x02"
+NONCE_SIZE = 12
+
+# Plaintexts shorter than this are stored uncompressed; zlib overhead dominates
+COMPRESS_MIN_SIZE = 256
+
+# Number of decrypted responses kept in memory (cleared whenever the key changes)
+DECRYPT_CACHE_SIZE = 4096
 
 
 def generate_salt() -> bytes:
@@ -21,21 +38,23 @@ def generate_salt() -> bytes:
 
 
 def derive_key(passphrase: str, salt: bytes) -> bytes:
-    """Derive an encryption key from a passphrase and salt using PBKDF2."""
+    """Derive a raw 32-byte encryption key from a passphrase and salt using PBKDF2."""
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
         length=32,
         salt=salt,
         iterations=480000,  # OWASP 2023 recommendation
     )
-    key = kdf.derive(passphrase.encode())
-    return base64.urlsafe_b64encode(key)
+    return kdf.derive(passphrase.encode())
 
 
 def set_encryption_key(key: bytes) -> None:
     """Set the module-level encryption key after authentication."""
-    global _encryption_key
+    global _encryption_key, _cipher, _legacy_fernet
     _encryption_key = key
+    _cipher = AESGCM(key)
+    _legacy_fernet = Fernet(base64.urlsafe_b64encode(key))
+    _clear_plaintext_caches()
 
 
 def get_encryption_key() -> bytes | None:
@@ -45,38 +64,73 @@ def get_encryption_key() -> bytes | None:
 
 def clear_encryption_key() -> None:
     """Clear the encryption key (for session timeout)."""
-    global _encryption_key
+    global _encryption_key, _cipher, _legacy_fernet
     _encryption_key = None
+    _cipher = None
+    _legacy_fernet = None
+    _clear_plaintext_caches()
 
 
-def encrypt_string(plaintext: str) -> bytes:
-    """Encrypt a string and return encrypted bytes."""
-    if _encryption_key is None:
+def _clear_plaintext_caches() -> None:
+    """Drop every in-memory cache that holds decrypted response text."""
+    from ktt.analysis.specificity import extract_specific_elements
+    from ktt.questions.followups import analyze_response
+
+    _decrypt_response_cached.cache_clear()
+    extract_specific_elements.cache_clear()
+    analyze_response.cache_clear()
+
+
+def encrypt_bytes(plaintext: bytes) -> bytes:
+    """Encrypt bytes with AES-256-GCM and return version + nonce + ciphertext."""
+    if _cipher is None:
         raise RuntimeError("Encryption key not set. User must authenticate first.")
 
-    f = Fernet(_encryption_key)
-    return f.encrypt(plaintext.encode())
+    version = AESGCM_VERSION
+    if len(plaintext) >= COMPRESS_MIN_SIZE:
+        compressed = zlib.compress(plaintext)
+        if len(compressed) < len(plaintext):
+            version, plaintext = AESGCM_ZLIB_VERSION, compressed
 
+    nonce = os.urandom(NONCE_SIZE)
+    return version + nonce + _cipher.encrypt(nonce, plaintext, None)
 
-def decrypt_string(ciphertext: bytes) -> str:
-    """Decrypt bytes and return the original string."""
-    if _encryption_key is None:
+
+def decrypt_bytes(ciphertext: bytes) -> bytes:
+    """Decrypt bytes and return the original plaintext bytes."""
+    if _cipher is None:
         raise RuntimeError("Encryption key not set. User must authenticate first.")
 
-    f = Fernet(_encryption_key)
-    return f.decrypt(ciphertext).decode()
+    version = ciphertext[:1]
+    if version not in (AESGCM_VERSION, AESGCM_ZLIB_VERSION):
+        return _legacy_fernet.decrypt(ciphertext)
+
+    nonce = ciphertext[1:1 + NONCE_SIZE]
+    plaintext = _cipher.decrypt(nonce, ciphertext[1 + NONCE_SIZE:], None)
+    if version == AESGCM_ZLIB_VERSION:
+        return zlib.decompress(plaintext)
+    return plaintext
+
+
+def encrypt_string(plaintext: str) -> bytes:
+    """Encrypt a string and return encrypted bytes."""
+    return encrypt_bytes(plaintext.encode())
+
+
+def decrypt_string(ciphertext: bytes) -> str:
+    """Decrypt bytes and return the original string."""
+    return decrypt_bytes(ciphertext).decode()
 
 
 def encrypt_json(data: Any) -> bytes:
     """Encrypt a JSON-serializable object and return encrypted bytes."""
-    json_str = json.dumps(data)
-    return encrypt_string(json_str)
+    return encrypt_bytes(json.dumps(data, separators=(",", ":")).encode())
 
 
 def decrypt_json(ciphertext: bytes) -> Any:
     """Decrypt bytes and return the original JSON object."""
-    json_str = decrypt_string(ciphertext)
-    return json.loads(json_str)
+    # json.loads reads UTF-8 bytes directly, so no intermediate str is needed
+    return json.loads(decrypt_bytes(ciphertext))
 
 
 def encrypt_response(text: str) -> bytes:
@@ -85,5 +139,16 @@ def encrypt_response(text: str) -> bytes:
 
 
 def decrypt_response(ciphertext: bytes) -> str:
-    """Decrypt a response text. Convenience wrapper with clear naming."""
+    """Decrypt a response text. Repeat decryptions are served from memory."""
+    return _decrypt_response_cached(ciphertext)
+
+
+@lru_cache(maxsize=DECRYPT_CACHE_SIZE)
+def _decrypt_response_cached(ciphertext: bytes) -> str:
+    """
+    Decrypt a response, memoized by ciphertext.
+
+    Each encryption produces a fresh ciphertext, so edited responses never
+    hit a stale entry; the cache only needs clearing when the key changes.
+    """
     return decrypt_string(ciphertext)
@@ -1,6 +1,6 @@
 """SQLAlchemy data models for Know Thy Taste."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import uuid4
 
@@ -13,12 +13,18 @@ from sqlalchemy import (
     DateTime,
     Text,
     ForeignKey,
+    Index,
     JSON,
     LargeBinary,
 )
 from sqlalchemy.orm import DeclarativeBase, relationship
 
 
+def utcnow() -> datetime:
+    """Get the current UTC time as a naive datetime, the form timestamps are stored in."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 def generate_uuid() -> str:
     """Generate a UUID string."""
     return str(uuid4())
@@ -34,7 +40,7 @@ class User(Base):
     __tablename__ = "users"
 
     id = Column(String, primary_key=True, default=generate_uuid)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow)
     password_hash = Column(LargeBinary, nullable=False)
     encryption_salt = Column(LargeBinary, nullable=False)
     consent_flags = Column(JSON, default=dict)
@@ -53,14 +59,14 @@ class Movie(Base):
     __tablename__ = "movies"
 
     id = Column(String, primary_key=True, default=generate_uuid)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
     title = Column(String, nullable=False)
     year = Column(Integer)
     genres = Column(JSON, default=list)  # List of genre strings
     watch_date = Column(DateTime)
     watch_context = Column(String)  # "theater", "home", "flight", etc.
     tmdb_id = Column(Integer)  # Optional TMDB reference
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow)
     last_analyzed = Column(DateTime)
 
     # Relationships
@@ -76,7 +82,7 @@ class Session(Base):
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
     session_type = Column(String, nullable=False)  # "deep-dive", "pattern-hunt", "temporal"
     status = Column(String, default="active")  # "active", "completed", "abandoned"
-    start_time = Column(DateTime, default=datetime.utcnow)
+    start_time = Column(DateTime, default=utcnow)
     end_time = Column(DateTime)
     movie_ids = Column(JSON, default=list)  # List of movie IDs in this session
     current_phase = Column(String, default="planning")  # "planning", "monitoring", "evaluation"
@@ -87,6 +93,10 @@ class Session(Base):
     user = relationship("User", back_populates="sessions")
     responses = relationship("Response", back_populates="session", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_sessions_user_status", "user_id", "status"),
+    )
+
 
 class Response(Base):
     """A single response to a question during a session."""
@@ -94,7 +104,7 @@ class Response(Base):
 
     id = Column(String, primary_key=True, default=generate_uuid)
     session_id = Column(String, ForeignKey("sessions.id"), nullable=False)
-    movie_id = Column(String, ForeignKey("movies.id"), nullable=False)
+    movie_id = Column(String, ForeignKey("movies.id"), nullable=False, index=True)
     question_key = Column(String, nullable=False)  # Reference to question bank
     question_text = Column(Text, nullable=False)  # Actual question asked
     response_text = Column(LargeBinary, nullable=False)  # Encrypted
@@ -102,12 +112,16 @@ class Response(Base):
     is_new_insight = Column(Boolean, default=False)
     specificity_score = Column(Float)  # Computed score 0-1
     follow_up_count = Column(Integer, default=0)  # How many follow-ups were needed
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow)
 
     # Relationships
     session = relationship("Session", back_populates="responses")
     movie = relationship("Movie", back_populates="responses")
 
+    __table_args__ = (
+        Index("ix_responses_session_movie", "session_id", "movie_id"),
+    )
+
 
 class Pattern(Base):
     """A detected pattern in the user's taste."""
@@ -121,12 +135,16 @@ class Pattern(Base):
     supporting_movie_ids = Column(JSON, default=list)
     supporting_evidence = Column(LargeBinary)  # Encrypted JSON of response excerpts
     validated_by_user = Column(Boolean)  # None = not validated, True/False = user response
-    first_detected = Column(DateTime, default=datetime.utcnow)
+    first_detected = Column(DateTime, default=utcnow)
     last_confirmed = Column(DateTime)
 
     # Relationships
     user = relationship("User", back_populates="patterns")
 
+    __table_args__ = (
+        Index("ix_patterns_user_validated", "user_id", "validated_by_user"),
+    )
+
 
 class TasteElement(Base):
     """An identified element of the user's taste (accumulated across sessions)."""
@@ -137,8 +155,12 @@ class TasteElement(Base):
     element_type = Column(String, nullable=False)  # "visual", "narrative", "thematic", etc.
     element_name = Column(String, nullable=False)  # e.g., "natural lighting", "unreliable narrator"
     importance_score = Column(Float, default=0.5)  # Learned over time
-    first_mentioned = Column(DateTime, default=datetime.utcnow)
+    first_mentioned = Column(DateTime, default=utcnow)
     mention_count = Column(Integer, default=1)
 
     # Relationships
     user = relationship("User", back_populates="taste_elements")
+
+    __table_args__ = (
+        Index("ix_taste_elements_user_importance", "user_id", "importance_score"),
+    )
@@ -6,9 +6,17 @@ Works gracefully when offline or without an API key.
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import hashlib
+import json
 import os
+import time
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
+from urllib.parse import urlencode
 
 import httpx
 
@@ -17,6 +25,164 @@ from ktt.core.database import get_data_dir
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
 TIMEOUT = 10.0  # seconds
 
+# Keep-alive connections held open for follow-up requests (search, then details)
+MAX_KEEPALIVE_CONNECTIONS = 4
+
+# Responses are cached on disk, one JSON file per request, under this directory
+CACHE_DIR_NAME = "tmdb_cache"
+
+# Most cached responses kept; the least recently written are evicted beyond this
+MAX_CACHE_FILES = 500
+
+# Movie details and credits rarely change; search results are refreshed daily
+DETAILS_CACHE_TTL = timedelta(days=30)
+SEARCH_CACHE_TTL = timedelta(days=1)
+
+# Requests in flight at once during bulk enrichment, to stay within rate limits
+ENRICH_CONCURRENCY = 8
+
+_client: Optional[httpx.Client] = None
+
+
+def _get_client() -> httpx.Client:
+    """Get the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.Client(
+            timeout=TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+        )
+        atexit.register(_client.close)
+    return _client
+
+
+def _cache_path(path: str, params: dict) -> Path:
+    """Get the cache file for a request, ignoring the API key."""
+    items = sorted((k, v) for k, v in params.items() if k != "api_key")
+    digest = hashlib.sha256(f"{path}?{urlencode(items)}".encode()).hexdigest()
+    return get_data_dir() / CACHE_DIR_NAME / f"{digest}.json"
+
+
+def _read_cache(cache_path: Path, ttl: timedelta) -> Optional[dict]:
+    """Read a cached response, or None if it is missing or stale (stale files are deleted)."""
+    try:
+        if time.time() - cache_path.stat().st_mtime < ttl.total_seconds():
+            return json.loads(cache_path.read_text())
+        cache_path.unlink()
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _write_cache(cache_path: Path, data: dict) -> None:
+    """Store a response in the cache, ignoring write failures."""
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        cache_path.write_text(json.dumps(data))
+        _evict_cache(cache_path.parent)
+    except OSError:
+        pass
+
+
+def _evict_cache(cache_dir: Path) -> None:
+    """Delete the oldest cached responses beyond MAX_CACHE_FILES."""
+    files = []
+    for path in cache_dir.glob("*.json"):
+        try:
+            files.append((path.stat().st_mtime, path))
+        except OSError:
+            pass  # Removed by another process
+
+    if len(files) <= MAX_CACHE_FILES:
+        return
+
+    files.sort()
+    for _, path in files[:len(files) - MAX_CACHE_FILES]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def _get_json(path: str, params: dict, ttl: timedelta) -> dict:
+    """GET a TMDB endpoint, serving from the on-disk cache while it is fresh."""
+    cache_path = _cache_path(path, params)
+    data = _read_cache(cache_path, ttl)
+    if data is not None:
+        return data
+
+    response = _get_client().get(f"{TMDB_BASE_URL}{path}", params=params)
+    response.raise_for_status()
+    data = response.json()
+    _write_cache(cache_path, data)
+    return data
+
+
+async def _aget_json(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    path: str,
+    params: dict,
+    ttl: timedelta,
+) -> dict:
+    """Async version of _get_json, limited by a shared semaphore."""
+    # Cache file I/O runs in a worker thread so it never blocks the event loop
+    cache_path = _cache_path(path, params)
+    data = await asyncio.to_thread(_read_cache, cache_path, ttl)
+    if data is not None:
+        return data
+
+    async with semaphore:
+        response = await client.get(f"{TMDB_BASE_URL}{path}", params=params)
+    response.raise_for_status()
+    data = response.json()
+    await asyncio.to_thread(_write_cache, cache_path, data)
+    return data
+
+
+def _async_client() -> httpx.AsyncClient:
+    """Create an async HTTP client with the same settings as the shared one."""
+    return httpx.AsyncClient(
+        timeout=TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+    )
+
+
+def _parse_details(data: dict) -> dict:
+    """Pick the fields we use out of a movie details response."""
+    release_date = data.get("release_date", "")
+    year = int(release_date[:4]) if release_date and len(release_date) >= 4 else None
+
+    return {
+        "title": data.get("title"),
+        "year": year,
+        "genres": [g["name"] for g in data.get("genres", [])],
+        "overview": data.get("overview"),
+        "runtime": data.get("runtime"),
+        "tagline": data.get("tagline"),
+    }
+
+
+def _parse_credits(data: dict) -> dict:
+    """Pick the director and top cast out of a credits response."""
+    # Get director from crew
+    director = None
+    for crew_member in data.get("crew", []):
+        if crew_member.get("job") == "Director":
+            director = crew_member.get("name")
+            break
+
+    # Get top cast
+    cast = [
+        member.get("name")
+        for member in data.get("cast", [])[:5]
+    ]
+
+    return {
+        "director": director,
+        "cast": cast,
+    }
+
 
 def get_api_key() -> Optional[str]:
     """Get the TMDB API key from environment or config file."""
@@ -26,6 +192,12 @@ def get_api_key() -> Optional[str]:
         return key
 
     # Then check config file
+    return _read_saved_api_key()
+
+
+@lru_cache(maxsize=1)
+def _read_saved_api_key() -> Optional[str]:
+    """Read the API key from the config file, once per process."""
     config_path = get_data_dir() / "tmdb_key"
     if config_path.exists():
         return config_path.read_text().strip()
@@ -37,6 +209,7 @@ def save_api_key(key: str) -> None:
     """Save the TMDB API key to config file."""
     config_path = get_data_dir() / "tmdb_key"
     config_path.write_text(key)
+    _read_saved_api_key.cache_clear()
 
 
 def remove_api_key() -> None:
@@ -44,6 +217,7 @@ def remove_api_key() -> None:
     config_path = get_data_dir() / "tmdb_key"
     if config_path.exists():
         config_path.unlink()
+    _read_saved_api_key.cache_clear()
 
 
 def is_configured() -> bool:
@@ -72,63 +246,82 @@ def search_movie(title: str, year: Optional[int] = None) -> list[dict]:
         params["year"] = str(year)
 
     try:
-        with httpx.Client(timeout=TIMEOUT) as client:
-            response = client.get(f"{TMDB_BASE_URL}/search/movie", params=params)
-            response.raise_for_status()
-            data = response.json()
+        data = _get_json("/search/movie", params, SEARCH_CACHE_TTL)
 
-            results = []
-            for item in data.get("results", [])[:10]:
-                release_date = item.get("release_date", "")
-                movie_year = int(release_date[:4]) if release_date and len(release_date) >= 4 else None
+        results = []
+        for item in data.get("results", [])[:10]:
+            release_date = item.get("release_date", "")
+            movie_year = int(release_date[:4]) if release_date and len(release_date) >= 4 else None
 
-                results.append({
-                    "id": item["id"],
-                    "title": item["title"],
-                    "year": movie_year,
-                    "overview": item.get("overview", "")[:200],
-                })
+            results.append({
+                "id": item["id"],
+                "title": item["title"],
+                "year": movie_year,
+                "overview": item.get("overview", "")[:200],
+            })
 
-            return results
+        return results
 
     except (httpx.HTTPError, httpx.TimeoutException, KeyError, ValueError):
         return []
 
 
-def get_movie_details(tmdb_id: int) -> Optional[dict]:
+async def _fetch_movies(
+    tmdb_ids: list[int],
+    details: bool = True,
+    credits: bool = True,
+) -> dict[int, dict]:
     """
-    Get detailed information about a movie.
+    Fetch details and/or credits for many movies concurrently over one client.
 
-    Returns dict with keys: title, year, genres, overview, runtime, tagline
-    Returns None if TMDB is not configured or request fails.
+    Returns a dict mapping each TMDB id to its parsed responses merged together.
+    Movies whose requests fail are left out; returns an empty dict if TMDB
+    is not configured.
     """
     api_key = get_api_key()
     if not api_key:
-        return None
+        return {}
+
+    params = {"api_key": api_key}
+    semaphore = asyncio.Semaphore(ENRICH_CONCURRENCY)
+
+    async def fetch(client: httpx.AsyncClient, tmdb_id: int) -> Optional[dict]:
+        requests = []
+        if details:
+            requests.append((f"/movie/{tmdb_id}", _parse_details))
+        if credits:
+            requests.append((f"/movie/{tmdb_id}/credits", _parse_credits))
+
+        try:
+            responses = await asyncio.gather(*(
+                _aget_json(client, semaphore, path, params, DETAILS_CACHE_TTL)
+                for path, _ in requests
+            ))
+            movie = {}
+            for (_, parse), data in zip(requests, responses):
+                movie.update(parse(data))
+            return movie
+        except (httpx.HTTPError, httpx.TimeoutException, KeyError, ValueError):
+            return None
+
+    async with _async_client() as client:
+        results = await asyncio.gather(*(fetch(client, tmdb_id) for tmdb_id in tmdb_ids))
+
+    return {
+        tmdb_id: movie
+        for tmdb_id, movie in zip(tmdb_ids, results)
+        if movie is not None
+    }
 
-    try:
-        with httpx.Client(timeout=TIMEOUT) as client:
-            response = client.get(
-                f"{TMDB_BASE_URL}/movie/{tmdb_id}",
-                params={"api_key": api_key}
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            release_date = data.get("release_date", "")
-            year = int(release_date[:4]) if release_date and len(release_date) >= 4 else None
-
-            return {
-                "title": data.get("title"),
-                "year": year,
-                "genres": [g["name"] for g in data.get("genres", [])],
-                "overview": data.get("overview"),
-                "runtime": data.get("runtime"),
-                "tagline": data.get("tagline"),
-            }
 
-    except (httpx.HTTPError, httpx.TimeoutException, KeyError, ValueError):
-        return None
+def get_movie_details(tmdb_id: int) -> Optional[dict]:
+    """
+    Get detailed information about a movie.
+
+    Returns dict with keys: title, year, genres, overview, runtime, tagline
+    Returns None if TMDB is not configured or request fails.
+    """
+    return asyncio.run(_fetch_movies([tmdb_id], credits=False)).get(tmdb_id)
 
 
 def get_movie_credits(tmdb_id: int) -> Optional[dict]:
@@ -138,50 +331,29 @@ def get_movie_credits(tmdb_id: int) -> Optional[dict]:
     Returns dict with keys: director, cast (list of names)
     Returns None if TMDB is not configured or request fails.
     """
-    api_key = get_api_key()
-    if not api_key:
-        return None
+    return asyncio.run(_fetch_movies([tmdb_id], details=False)).get(tmdb_id)
 
-    try:
-        with httpx.Client(timeout=TIMEOUT) as client:
-            response = client.get(
-                f"{TMDB_BASE_URL}/movie/{tmdb_id}/credits",
-                params={"api_key": api_key}
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Get director from crew
-            director = None
-            for crew_member in data.get("crew", []):
-                if crew_member.get("job") == "Director":
-                    director = crew_member.get("name")
-                    break
-
-            # Get top cast
-            cast = [
-                member.get("name")
-                for member in data.get("cast", [])[:5]
-            ]
-
-            return {
-                "director": director,
-                "cast": cast,
-            }
 
-    except (httpx.HTTPError, httpx.TimeoutException, KeyError, ValueError):
-        return None
+async def enrich_movies(tmdb_ids: list[int]) -> dict[int, dict]:
+    """
+    Fetch details and credits for many movies concurrently.
+
+    Returns a dict mapping each TMDB id to its details merged with its credits.
+    Movies whose requests fail are left out; returns an empty dict if TMDB
+    is not configured.
+    """
+    return await _fetch_movies(tmdb_ids)
 
 
 def validate_api_key(key: str) -> bool:
     """Validate that an API key works with TMDB."""
     try:
-        with httpx.Client(timeout=TIMEOUT) as client:
-            response = client.get(
-                f"{TMDB_BASE_URL}/configuration",
-                params={"api_key": key}
-            )
-            return response.status_code == 200
+        client = _get_client()
+        response = client.get(
+            f"{TMDB_BASE_URL}/configuration",
+            params={"api_key": key}
+        )
+        return response.status_code == 200
     except (httpx.HTTPError, httpx.TimeoutException):
         return False
 
@@ -1,13 +1,14 @@
 """Consent management for Know Thy Taste."""
 
-from datetime import datetime
+import time
+from contextlib import nullcontext
 from typing import Optional
 
 import questionary
 from rich.console import Console
 from rich.panel import Panel
-from rich.markdown import Markdown
 from rich import box
+from sqlalchemy.orm import Session as DbSession
 
 from ktt.cli.ui import print_success, print_warning, print_info, print_header
 from ktt.core.database import get_session
@@ -15,6 +16,12 @@ from ktt.core.models import User
 
 console = Console()
 
+# Seconds a user's consent flags are reused before being read again
+CONSENT_CACHE_TTL = 60.0
+
+# User id -> (monotonic time read, consent flags)
+_consent_cache: dict[str, tuple[float, dict]] = {}
+
 # Consent types with descriptions
 CONSENT_TYPES = {
     "store_movie_titles": {
@@ -44,6 +51,16 @@ CONSENT_TYPES = {
     },
 }
 
+# Static markup for each consent in status listings: (key, label, description line)
+CONSENT_STATUS_LINES = [
+    (
+        key,
+        info["name"] + (" [dim](required)[/dim]" if info["required"] else ""),
+        f"  [dim]{info['description']}[/dim]",
+    )
+    for key, info in CONSENT_TYPES.items()
+]
+
 PRIVACY_POLICY = """
 # Know Thy Taste Privacy Policy
 
@@ -84,6 +101,8 @@ You control what you share—feel free to be as private or open as you like.
 
 def display_privacy_policy() -> None:
     """Display the privacy policy."""
+    from rich.markdown import Markdown
+
     console.print(Panel(
         Markdown(PRIVACY_POLICY),
         title="[bold]Privacy Policy[/bold]",
@@ -138,22 +157,13 @@ def run_initial_consent() -> bool:
     return True
 
 
-def apply_pending_consent(user_id: str) -> None:
-    """Apply pending consent flags to a user."""
+def take_pending_consent() -> Optional[dict]:
+    """Return the flags chosen in run_initial_consent, clearing them."""
     import ktt.privacy.consent as consent_module
 
     pending = getattr(consent_module, "_pending_consent", None)
-    if not pending:
-        return
-
-    with get_session() as db:
-        user = db.query(User).filter(User.id == user_id).first()
-        if user:
-            user.consent_flags = pending
-            user.last_privacy_review = datetime.utcnow()
-            db.commit()
-
     consent_module._pending_consent = None
+    return pending
 
 
 def show_consent_status(user: User) -> None:
@@ -161,20 +171,14 @@ def show_consent_status(user: User) -> None:
     print_header("Privacy Settings")
 
     with get_session() as db:
-        db_user = db.query(User).filter(User.id == user.id).first()
-        flags = db_user.consent_flags or {}
-        last_review = db_user.last_privacy_review
+        consents = has_consents(user, [key for key, _, _ in CONSENT_STATUS_LINES], db=db)
+        last_review = db.query(User.last_privacy_review).filter(User.id == user.id).scalar()
 
     console.print("[bold]Current Consent Choices:[/bold]\n")
 
-    for key, info in CONSENT_TYPES.items():
-        status = flags.get(key, False)
-        status_icon = "[green]✓[/green]" if status else "[red]✗[/red]"
-        required_note = " [dim](required)[/dim]" if info["required"] else ""
-
-        console.print(f"{status_icon} {info['name']}{required_note}")
-        console.print(f"  [dim]{info['description']}[/dim]")
-        console.print()
+    for key, label, description in CONSENT_STATUS_LINES:
+        status_icon = "[green]✓[/green]" if consents[key] else "[red]✗[/red]"
+        console.print(f"{status_icon} {label}\n{description}\n")
 
     if last_review:
         console.print(f"[dim]Last reviewed: {last_review.strftime('%Y-%m-%d')}[/dim]")
@@ -202,7 +206,8 @@ def withdraw_consent(user: User, consent_type: str) -> bool:
 
     with get_session() as db:
         db_user = db.query(User).filter(User.id == user.id).first()
-        flags = db_user.consent_flags or {}
+        # Copy so the reassignment below registers as a change to the JSON column
+        flags = dict(db_user.consent_flags or {})
 
         if not flags.get(consent_type, False):
             print_info(f"'{consent_type}' is already withdrawn.")
@@ -221,24 +226,60 @@ def withdraw_consent(user: User, consent_type: str) -> bool:
             print_info("Withdrawal cancelled.")
             return False
 
-        # Update consent
+        # Update consent and clean up associated data in one transaction
         flags[consent_type] = False
         db_user.consent_flags = flags
-        db.commit()
 
-        # Clean up associated data if needed
         if consent_type == "enable_pattern_analysis":
             from ktt.core.models import Pattern
             db.query(Pattern).filter(Pattern.user_id == user.id).delete()
-            db.commit()
+            # Forget the last run so detection restarts if consent is granted again
+            settings = dict(db_user.settings or {})
+            if settings.pop("last_pattern_detection", None) is not None:
+                db_user.settings = settings
+
+        db.commit()
+
+    forget_consent_flags(user.id)
 
     print_success(f"Consent for '{consent_type}' has been withdrawn.")
     return True
 
 
-def has_consent(user: User, consent_type: str) -> bool:
-    """Check if user has given consent for a specific type."""
-    with get_session() as db:
-        db_user = db.query(User).filter(User.id == user.id).first()
-        flags = db_user.consent_flags or {}
-        return flags.get(consent_type, False)
+def has_consent(user: User, consent_type: str, db: Optional[DbSession] = None) -> bool:
+    """Check if user has given consent for a specific type.
+
+    Pass ``db`` to read through an already open session instead of a new one.
+    """
+    return _get_consent_flags(user.id, db).get(consent_type, False)
+
+
+def has_consents(
+    user: User,
+    consent_types: list[str],
+    db: Optional[DbSession] = None,
+) -> dict[str, bool]:
+    """Check several consent types at once with a single lookup.
+
+    Pass ``db`` to read through an already open session instead of a new one.
+    """
+    flags = _get_consent_flags(user.id, db)
+    return {consent_type: flags.get(consent_type, False) for consent_type in consent_types}
+
+
+def forget_consent_flags(user_id: str) -> None:
+    """Drop cached consent flags after they are written."""
+    _consent_cache.pop(user_id, None)
+
+
+def _get_consent_flags(user_id: str, db: Optional[DbSession] = None) -> dict:
+    """Get a user's consent flags, reusing a recent read."""
+    cached = _consent_cache.get(user_id)
+    if cached and time.monotonic() - cached[0] < CONSENT_CACHE_TTL:
+        return cached[1]
+
+    with nullcontext(db) if db is not None else get_session() as db:
+        flags = db.query(User.consent_flags).filter(User.id == user_id).scalar() or {}
+
+    _consent_cache[user_id] = (time.monotonic(), flags)
+    return flags
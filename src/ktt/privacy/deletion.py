@@ -16,18 +16,10 @@ def delete_all_data() -> None:
     # Delete database
     delete_database()
 
-    # Remove any exports
+    # Remove exports and any remaining files in one recursive delete
     data_dir = get_data_dir()
-    exports_dir = data_dir / "exports"
-    if exports_dir.exists():
-        shutil.rmtree(exports_dir)
-
-    # Remove any remaining files in data directory
-    for item in data_dir.iterdir():
-        if item.is_file():
-            item.unlink()
-        elif item.is_dir():
-            shutil.rmtree(item)
+    shutil.rmtree(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
 
     print_info("All data has been permanently deleted.")
 
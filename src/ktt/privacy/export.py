@@ -1,9 +1,14 @@
 """Data export functionality for Know Thy Taste."""
 
 import json
+import os
+import tempfile
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, TextIO
+
+from sqlalchemy.orm import Session as DbSession, load_only, selectinload
 
 from ktt.core.database import get_session, get_data_dir
 from ktt.core.models import User, Movie, Session, Response, Pattern, TasteElement
@@ -11,22 +16,56 @@ from ktt.core.encryption import decrypt_response, decrypt_json
 from ktt.privacy.consent import has_consent
 from ktt.cli.ui import print_warning, print_info
 
+# Movies (and their responses) loaded per query while exporting
+EXPORT_CHUNK_SIZE = 500
+
 
 def export_data(user: User, format: str, output_path: Optional[Path] = None) -> Path:
     """Export all user data in the specified format."""
-    if not has_consent(user, "enable_export"):
-        print_warning("Export is not enabled. Run 'ktt privacy review' to enable it.")
-        raise ValueError("Export consent not given")
-
-    if format == "json":
-        return export_json(user, output_path)
-    elif format == "markdown":
-        return export_markdown(user, output_path)
-    else:
-        raise ValueError(f"Unknown format: {format}")
-
-
-def export_json(user: User, output_path: Optional[Path] = None) -> Path:
+    # The consent check and the export share one database session
+    with get_session() as db:
+        if not has_consent(user, "enable_export", db=db):
+            print_warning("Export is not enabled. Run 'ktt privacy review' to enable it.")
+            raise ValueError("Export consent not given")
+
+        if format == "json":
+            return export_json(user, output_path, db=db)
+        elif format == "markdown":
+            return export_markdown(user, output_path, db=db)
+        else:
+            raise ValueError(f"Unknown format: {format}")
+
+
+def _session_scope(db: Optional[DbSession]):
+    """Reuse the caller's database session, or open a new one."""
+    return nullcontext(db) if db is not None else get_session()
+
+
+@contextmanager
+def _atomic_write(output_path: Path) -> Iterator[TextIO]:
+    """
+    Open a temp file next to output_path, moving it into place only on success.
+
+    An interrupted or failed export never leaves a truncated file behind.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            yield f
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def export_json(
+    user: User,
+    output_path: Optional[Path] = None,
+    db: Optional[DbSession] = None,
+) -> Path:
     """Export data as JSON."""
     export_dir = get_data_dir() / "exports"
     export_dir.mkdir(exist_ok=True)
@@ -35,15 +74,18 @@ def export_json(user: User, output_path: Optional[Path] = None) -> Path:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_path = export_dir / f"ktt_export_{timestamp}.json"
 
-    data = gather_export_data(user)
-
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    # Movies are written as they are read, so the full export is never held in memory
+    with _session_scope(db) as db, _atomic_write(Path(output_path)) as f:
+        _write_json_stream(_export_sections(db, user), f)
 
     return output_path
 
 
-def export_markdown(user: User, output_path: Optional[Path] = None) -> Path:
+def export_markdown(
+    user: User,
+    output_path: Optional[Path] = None,
+    db: Optional[DbSession] = None,
+) -> Path:
     """Export data as Markdown."""
     export_dir = get_data_dir() / "exports"
     export_dir.mkdir(exist_ok=True)
@@ -52,105 +94,170 @@ def export_markdown(user: User, output_path: Optional[Path] = None) -> Path:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_path = export_dir / f"ktt_export_{timestamp}.md"
 
-    data = gather_export_data(user)
+    data = gather_export_data(user, db=db)
     markdown = generate_markdown(data)
 
-    with open(output_path, "w") as f:
+    with _atomic_write(Path(output_path)) as f:
         f.write(markdown)
 
     return output_path
 
 
-def gather_export_data(user: User) -> dict:
+def gather_export_data(user: User, db: Optional[DbSession] = None) -> dict:
     """Gather all user data for export."""
-    with get_session() as db:
-        # Get user's movies
-        movies = db.query(Movie).filter(Movie.user_id == user.id).all()
-        movie_data = []
-
-        for movie in movies:
-            movie_dict = {
-                "id": movie.id,
-                "title": movie.title,
-                "year": movie.year,
-                "genres": movie.genres,
-                "watch_date": movie.watch_date.isoformat() if movie.watch_date else None,
-                "watch_context": movie.watch_context,
-                "created_at": movie.created_at.isoformat() if movie.created_at else None,
-                "responses": [],
-            }
-
-            # Get responses for this movie
-            responses = db.query(Response).filter(Response.movie_id == movie.id).all()
-            for resp in responses:
-                try:
-                    response_text = decrypt_response(resp.response_text)
-                except Exception:
-                    response_text = "[Unable to decrypt]"
-
-                movie_dict["responses"].append({
-                    "question": resp.question_text,
-                    "response": response_text,
-                    "confidence": resp.confidence,
-                    "is_new_insight": resp.is_new_insight,
-                    "created_at": resp.created_at.isoformat() if resp.created_at else None,
-                })
-
-            movie_data.append(movie_dict)
-
-        # Get patterns
-        patterns = db.query(Pattern).filter(Pattern.user_id == user.id).all()
-        pattern_data = []
-
-        for pattern in patterns:
-            # Get supporting movie titles
-            supporting_movies = db.query(Movie).filter(
-                Movie.id.in_(pattern.supporting_movie_ids or [])
-            ).all()
-
-            pattern_data.append({
-                "type": pattern.pattern_type,
-                "description": pattern.description,
-                "confidence": pattern.confidence,
-                "supporting_movies": [m.title for m in supporting_movies],
-                "validated": pattern.validated_by_user,
-                "first_detected": pattern.first_detected.isoformat() if pattern.first_detected else None,
-            })
+    with _session_scope(db) as db:
+        data = _export_sections(db, user)
+        data["movies"] = list(data["movies"])
+
+    return data
+
+
+def _export_sections(db: DbSession, user: User) -> dict:
+    """Build the export data, with movies left as a lazy iterator over ``db``."""
+    # Get patterns
+    # Only the exported columns; skips the encrypted supporting evidence
+    patterns = db.query(Pattern).options(load_only(
+        Pattern.pattern_type,
+        Pattern.description,
+        Pattern.confidence,
+        Pattern.supporting_movie_ids,
+        Pattern.validated_by_user,
+        Pattern.first_detected,
+    )).filter(Pattern.user_id == user.id).order_by(Pattern.first_detected).all()
+    pattern_data = []
+
+    # Supporting movies are the user's own; look up their titles in one query
+    movie_rows = db.query(Movie.id, Movie.title).filter(
+        Movie.user_id == user.id
+    ).order_by(Movie.created_at)
+    movies_by_id = {mid: (i, title) for i, (mid, title) in enumerate(movie_rows)}
+
+    for pattern in patterns:
+        # Get supporting movie titles, in collection order
+        supporting_movies = sorted(
+            movies_by_id[mid]
+            for mid in set(pattern.supporting_movie_ids or [])
+            if mid in movies_by_id
+        )
+
+        pattern_data.append({
+            "type": pattern.pattern_type,
+            "description": pattern.description,
+            "confidence": pattern.confidence,
+            "supporting_movies": [title for _, title in supporting_movies],
+            "validated": pattern.validated_by_user,
+            "first_detected": pattern.first_detected.isoformat() if pattern.first_detected else None,
+        })
+
+    # Get taste elements, most important first
+    elements = db.query(TasteElement).filter(
+        TasteElement.user_id == user.id
+    ).order_by(TasteElement.importance_score.desc(), TasteElement.first_mentioned).all()
+    element_data = [
+        {
+            "type": e.element_type,
+            "name": e.element_name,
+            "importance": e.importance_score,
+            "mention_count": e.mention_count,
+        }
+        for e in elements
+    ]
 
-        # Get taste elements
-        elements = db.query(TasteElement).filter(TasteElement.user_id == user.id).all()
-        element_data = [
-            {
-                "type": e.element_type,
-                "name": e.element_name,
-                "importance": e.importance_score,
-                "mention_count": e.mention_count,
-            }
-            for e in elements
-        ]
-
-        # Get session history
-        sessions = db.query(Session).filter(Session.user_id == user.id).all()
-        session_data = [
-            {
-                "type": s.session_type,
-                "status": s.status,
-                "start_time": s.start_time.isoformat() if s.start_time else None,
-                "end_time": s.end_time.isoformat() if s.end_time else None,
-            }
-            for s in sessions
-        ]
+    # Get session history
+    sessions = db.query(Session).options(load_only(
+        Session.session_type, Session.status, Session.start_time, Session.end_time,
+    )).filter(
+        Session.user_id == user.id
+    ).order_by(Session.start_time).all()
+    session_data = [
+        {
+            "type": s.session_type,
+            "status": s.status,
+            "start_time": s.start_time.isoformat() if s.start_time else None,
+            "end_time": s.end_time.isoformat() if s.end_time else None,
+        }
+        for s in sessions
+    ]
 
     return {
         "export_date": datetime.now().isoformat(),
         "privacy_notice": "This file contains your personal reflections. Handle with care.",
-        "movies": movie_data,
+        "movies": _iter_movie_data(db, user),
         "patterns": pattern_data,
         "taste_elements": element_data,
         "sessions": session_data,
     }
 
 
+def _iter_movie_data(db: DbSession, user: User) -> Iterator[dict]:
+    """Yield export entries for the user's movies, reading them a chunk at a time."""
+    # Each chunk of movies has its responses loaded by one extra IN query,
+    # fetching only the columns that are exported
+    movies = db.query(Movie).filter(
+        Movie.user_id == user.id
+    ).options(
+        selectinload(Movie.responses).load_only(
+            Response.movie_id,
+            Response.question_text,
+            Response.response_text,
+            Response.confidence,
+            Response.is_new_insight,
+            Response.created_at,
+        ),
+    ).yield_per(EXPORT_CHUNK_SIZE)
+
+    for movie in movies:
+        movie_dict = {
+            "id": movie.id,
+            "title": movie.title,
+            "year": movie.year,
+            "genres": movie.genres,
+            "watch_date": movie.watch_date.isoformat() if movie.watch_date else None,
+            "watch_context": movie.watch_context,
+            "created_at": movie.created_at.isoformat() if movie.created_at else None,
+            "responses": [],
+        }
+
+        for resp in movie.responses:
+            try:
+                response_text = decrypt_response(resp.response_text)
+            except Exception:
+                response_text = "[Unable to decrypt]"
+
+            movie_dict["responses"].append({
+                "question": resp.question_text,
+                "response": response_text,
+                "confidence": resp.confidence,
+                "is_new_insight": resp.is_new_insight,
+                "created_at": resp.created_at.isoformat() if resp.created_at else None,
+            })
+
+        yield movie_dict
+
+
+def _write_json_stream(data: dict, f: TextIO) -> None:
+    """
+    Write data as json.dump(data, f, indent=2) would, but consume iterator
+    values item by item instead of materializing them first.
+    """
+    f.write("{")
+    for i, (key, value) in enumerate(data.items()):
+        f.write(",\n  " if i else "\n  ")
+        f.write(f"{json.dumps(key)}: ")
+
+        if not isinstance(value, Iterator):
+            f.write(json.dumps(value, indent=2, default=str).replace("\n", "\n  "))
+            continue
+
+        empty = True
+        for item in value:
+            f.write("[\n    " if empty else ",\n    ")
+            f.write(json.dumps(item, indent=2, default=str).replace("\n", "\n    "))
+            empty = False
+        f.write("[]" if empty else "\n  ]")
+    f.write("\n}")
+
+
 def generate_markdown(data: dict) -> str:
     """Generate a Markdown document from export data."""
     lines = [
@@ -196,7 +303,7 @@ def generate_markdown(data: dict) -> str:
             "## Taste Elements",
             "",
         ])
-        for elem in sorted(data["taste_elements"], key=lambda x: -x["importance"]):
+        for elem in data["taste_elements"]:  # Already ordered by importance
             lines.append(f"- **{elem['name']}** ({elem['type']}) - mentioned {elem['mention_count']}x")
         lines.append("")
 
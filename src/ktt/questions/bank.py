@@ -6,11 +6,12 @@ Each question includes hints and example good responses.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class Question:
     """A question in the bank."""
     key: str
@@ -21,10 +22,16 @@ class Question:
     example_good: Optional[str] = None
     example_vague: Optional[str] = None
     requires_specificity: bool = True
+    has_movie_placeholder: bool = field(init=False, repr=False)
+    text_lower: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "has_movie_placeholder", "{movie}" in self.text)
+        object.__setattr__(self, "text_lower", self.text.lower())
 
 
 # PLANNING PHASE - What did you notice?
-PLANNING_QUESTIONS = [
+PLANNING_QUESTIONS = (
     Question(
         key="first_memory",
         text="Before we analyze this film, what's the first specific moment or scene that comes to mind when you think of {movie}?",
@@ -62,10 +69,10 @@ PLANNING_QUESTIONS = [
         category="thematic",
         hint="Context shapes experience. Theater vs. laptop, alone vs. with someone, tired vs. alert.",
     ),
-]
+)
 
 # MONITORING PHASE - How did you engage?
-MONITORING_QUESTIONS = [
+MONITORING_QUESTIONS = (
     Question(
         key="attention_captured",
         text="Think about a moment when your attention was most completely captured. What was happening in that exact scene?",
@@ -117,10 +124,10 @@ MONITORING_QUESTIONS = [
         category="narrative",
         hint="Time perception reveals engagement. When did the film earn your full presence?",
     ),
-]
+)
 
 # EVALUATION PHASE - Why did it matter?
-EVALUATION_QUESTIONS = [
+EVALUATION_QUESTIONS = (
     Question(
         key="emotional_impact",
         text="Looking back, what element had the most emotional impact on you—and what specifically about it?",
@@ -179,22 +186,22 @@ EVALUATION_QUESTIONS = [
         category="narrative",
         hint="Not just what happened, but how it was revealed to you.",
     ),
-]
+)
 
-# Organize questions by phase
-QUESTIONS_BY_PHASE = {
+# Organize questions by phase (read-only; the bank is shared by every session)
+QUESTIONS_BY_PHASE = MappingProxyType({
     "planning": PLANNING_QUESTIONS,
     "monitoring": MONITORING_QUESTIONS,
     "evaluation": EVALUATION_QUESTIONS,
-}
+})
 
 # All questions indexed by key
-ALL_QUESTIONS = {q.key: q for phase in QUESTIONS_BY_PHASE.values() for q in phase}
+ALL_QUESTIONS = MappingProxyType({q.key: q for phase in QUESTIONS_BY_PHASE.values() for q in phase})
 
 
-def get_questions_for_phase(phase: str) -> list[Question]:
+def get_questions_for_phase(phase: str) -> tuple[Question, ...]:
     """Get all questions for a specific phase."""
-    return QUESTIONS_BY_PHASE.get(phase, [])
+    return QUESTIONS_BY_PHASE.get(phase, ())
 
 
 def get_question(key: str) -> Optional[Question]:
@@ -204,4 +211,7 @@ def get_question(key: str) -> Optional[Question]:
 
 def format_question(question: Question, movie_title: str) -> str:
     """Format a question with the movie title inserted."""
-    return question.text.format(movie=movie_title)
+    if not question.has_movie_placeholder:
+        return question.text
+    # {movie} is the only placeholder, so a plain replace skips format parsing
+    return question.text.replace("{movie}", movie_title)
@@ -5,162 +5,235 @@ Detects vague responses and provides targeted follow-ups to elicit specificity.
 
 from __future__ import annotations
 
+import random
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class VaguePattern:
     """A pattern that indicates a vague response."""
     pattern: str  # regex pattern
     category: str  # what type of vagueness
-    follow_ups: list[str]  # follow-up questions to ask
+    follow_ups: tuple[str, ...]  # follow-up questions to ask
+    compiled: re.Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "compiled", re.compile(self.pattern, re.IGNORECASE))
 
 
 # Patterns that indicate vague responses
-VAGUE_PATTERNS = [
+VAGUE_PATTERNS = (
     VaguePattern(
         pattern=r"\bgood acting\b|\bgreat acting\b|\bacting was good\b",
         category="acting",
-        follow_ups=[
+        follow_ups=(
             "Which actor specifically?",
             "Can you describe a moment where their performance stood out?",
             "What exactly were they doing that worked?",
             "How was their approach different from what you typically see?",
-        ],
+        ),
     ),
     VaguePattern(
         pattern=r"\binteresting\b(?! because)(?! in that)(?! how)",
         category="vague_positive",
-        follow_ups=[
+        follow_ups=(
             "What made it interesting, specifically?",
             "Interesting compared to what?",
             "Can you point to the exact moment that felt interesting?",
             "Interesting in what way—surprising? Unusual? Thought-provoking?",
-        ],
+        ),
     ),
     VaguePattern(
         pattern=r"\bbeautiful cinematography\b|\bgreat cinematography\b|\bvisually stunning\b",
         category="cinematography",
-        follow_ups=[
+        follow_ups=(
             "Can you describe one specific shot that struck you?",
             "Was it the framing, the lighting, the movement, or something else?",
             "What made it beautiful—the composition, colors, or mood?",
             "Close your eyes and describe one image from the film.",
-        ],
+        ),
     ),
     VaguePattern(
         pattern=r"\bgreat soundtrack\b|\bgood music\b|\bmusic was great\b|\bamazing score\b",
         category="music",
-        follow_ups=[
+        follow_ups=(
             "Can you hum or describe a specific piece from the score?",
             "When in the film did the music most affect you?",
             "What did the music add that wouldn't be there without it?",
             "Was it the melody, the instruments, or how it interacted with the scene?",
-        ],
+        ),
     ),
     VaguePattern(
         pattern=r"\bwell written\b|\bgood writing\b|\bgreat dialogue\b",
         category="writing",
-        follow_ups=[
+        follow_ups=(
             "Can you quote or paraphrase a line that stuck with you?",
             "What made the writing effective—naturalistic? Witty? Poetic?",
             "Was there a conversation or monologue that particularly worked?",
             "How would you describe the voice of this screenplay?",
-        ],
+        ),
     ),
     VaguePattern(
         pattern=r"\bi liked it\b|\bit was good\b|\treally enjoyed it\b",
         category="generic_positive",
-        follow_ups=[
+        follow_ups=(
             "What specifically did you like about it?",
             "If you had to pick one element that made it work, what would it be?",
             "What kept you engaged?",
             "What would you tell a friend about why they should watch it?",
-        ],
+        ),
     ),
     VaguePattern(
         pattern=r"\bpowerful\b(?! because)|\bmoving\b(?! because)|\bemotional\b(?! because)",
         category="emotional_vague",
-        follow_ups=[
+        follow_ups=(
             "What specifically made it powerful/moving?",
             "Which scene hit you the hardest?",
             "What were you feeling in that moment?",
             "Was it the content, the execution, or both?",
-        ],
+        ),
     ),
     VaguePattern(
         pattern=r"\bthe ending\b(?! where)(?! when)|\bthe beginning\b(?! where)(?! when)",
         category="structural_vague",
-        follow_ups=[
+        follow_ups=(
             "What about the ending specifically?",
             "Describe the moment in the ending that affected you.",
             "What did the ending make you feel, and why?",
             "How did it land differently than you expected?",
-        ],
+        ),
     ),
     VaguePattern(
         pattern=r"\brelatable\b|\brelateable\b",
         category="relatable",
-        follow_ups=[
+        follow_ups=(
             "What specifically did you relate to?",
             "Was it a character, a situation, or a feeling?",
             "What from your own experience connected to this?",
             "Can you describe the moment you felt that connection?",
-        ],
+        ),
     ),
     VaguePattern(
         pattern=r"\bperfect\b|\bflawless\b|\bmasterpiece\b",
         category="hyperbole",
-        follow_ups=[
+        follow_ups=(
             "What made it so effective for you?",
             "Which elements came together particularly well?",
             "Was there anything that almost didn't work but somehow did?",
             "What sets it apart from other films you've loved?",
-        ],
+        ),
     ),
-]
+)
+
+# Every vague pattern in one alternation, so a response with none of them
+# is cleared by a single search
+ANY_VAGUE_PATTERN = re.compile(
+    "|".join(f"(?:{p.pattern})" for p in VAGUE_PATTERNS), re.IGNORECASE
+)
 
 # Short response threshold
 MIN_RESPONSE_LENGTH = 50  # characters
 
+# Specificity indicators: (trigger words, pattern, score delta). Single-word
+# indicators are looked up in the response's word set; phrases and anything
+# needing context stay regexes. Either one firing applies the delta once.
+SPECIFICITY_INDICATORS = [
+    # Positive indicators (increase score)
+    (None, r"\bwhen\b.*\bwas\b", 0.1),  # Temporal specificity
+    (None, r"\bthe scene where\b", 0.15),  # Scene reference
+    ({"specifically"}, None, 0.1),
+    ({"exactly"}, None, 0.1),
+    (None, r"\bi remember\b", 0.1),  # Memory marker
+    (None, r"\bthe moment\b", 0.1),  # Moment reference
+    (None, r'"[^"]+?"', 0.15),  # Quoted dialogue
+    (None, r"\d", 0.05),  # Numbers (often indicate specificity)
+    ({"first", "then", "after", "before"}, None, 0.1),  # Sequence words
+    ({"face", "eyes", "hands", "voice"}, None, 0.1),  # Body/performance details
+    ({"shot", "frame", "cut", "angle"}, None, 0.1),  # Technical terms
+    # Negative indicators (decrease score)
+    (None, r"\bkind of\b|\bsort of\b", -0.1),
+    ({"maybe"}, r"\bi guess\b", -0.1),
+    ({"overall"}, r"\bin general\b", -0.1),
+    (None, r"\bjust\b.*\breally\b", -0.1),  # Hedging
+]
 
-@dataclass
+SCORE_INDICATORS = [
+    (
+        frozenset(words) if words else None,
+        re.compile(pattern, re.IGNORECASE) if pattern else None,
+        delta,
+    )
+    for words, pattern, delta in SPECIFICITY_INDICATORS
+]
+
+# For each indicator, the most the ones after it can still take off the score.
+# Once a running score clears 1.0 by more than that, it is certain to clamp.
+REMAINING_PENALTY = [
+    sum(min(delta, 0.0) for *_, delta in SCORE_INDICATORS[i + 1:])
+    for i in range(len(SCORE_INDICATORS))
+]
+
+WORD_REGEX = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
 class VagueAnalysis:
     """Result of analyzing a response for vagueness."""
+    # Declared by hand; dataclass(slots=True) needs Python 3.10
+    __slots__ = ("is_vague", "vagueness_type", "suggested_follow_ups", "specificity_score")
+
     is_vague: bool
     vagueness_type: Optional[str]
-    suggested_follow_ups: list[str]
+    suggested_follow_ups: tuple[str, ...]
     specificity_score: float  # 0-1, where 1 is highly specific
 
 
-def analyze_response(response: str) -> VagueAnalysis:
-    """Analyze a response for vagueness and generate follow-ups."""
-    response_lower = response.lower().strip()
+# Results that never vary, built once; VagueAnalysis is frozen so they can be shared
+TOO_SHORT_ANALYSIS = VagueAnalysis(
+    is_vague=True,
+    vagueness_type="too_short",
+    suggested_follow_ups=(
+        "Can you elaborate on that?",
+        "Tell me more—what specifically do you mean?",
+        "I'd like to understand this better. Can you expand?",
+    ),
+    specificity_score=0.2,
+)
+
+PATTERN_ANALYSES = {
+    pattern.category: VagueAnalysis(
+        is_vague=True,
+        vagueness_type=pattern.category,
+        suggested_follow_ups=pattern.follow_ups,
+        specificity_score=0.3,
+    )
+    for pattern in VAGUE_PATTERNS
+}
+
+# Follow-ups for responses that match no pattern but score low
+LOW_SPECIFICITY_FOLLOW_UPS = (
+    "Can you be more specific? Describe a particular moment.",
+    "Give me the details—what exactly happened in that scene?",
+    "I want to see it through your eyes. Describe it like I haven't seen the film.",
+)
+
 
+@lru_cache(maxsize=1024)
+def analyze_response(response: str) -> VagueAnalysis:
+    """Analyze a response for vagueness and generate follow-ups (memoized per text)."""
     # Check for short responses
     if len(response) < MIN_RESPONSE_LENGTH:
-        return VagueAnalysis(
-            is_vague=True,
-            vagueness_type="too_short",
-            suggested_follow_ups=[
-                "Can you elaborate on that?",
-                "Tell me more—what specifically do you mean?",
-                "I'd like to understand this better. Can you expand?",
-            ],
-            specificity_score=0.2,
-        )
+        return TOO_SHORT_ANALYSIS
 
-    # Check for pattern matches
-    for pattern in VAGUE_PATTERNS:
-        if re.search(pattern.pattern, response_lower):
-            return VagueAnalysis(
-                is_vague=True,
-                vagueness_type=pattern.category,
-                suggested_follow_ups=pattern.follow_ups,
-                specificity_score=0.3,
-            )
+    # Check for pattern matches; on a hit, the first pattern in list order wins.
+    # The patterns ignore case, so the response is searched as typed.
+    if ANY_VAGUE_PATTERN.search(response):
+        for pattern in VAGUE_PATTERNS:
+            if pattern.compiled.search(response):
+                return PATTERN_ANALYSES[pattern.category]
 
     # Calculate specificity score based on indicators
     score = calculate_specificity_score(response)
@@ -169,18 +242,14 @@ def analyze_response(response: str) -> VagueAnalysis:
         return VagueAnalysis(
             is_vague=True,
             vagueness_type="low_specificity",
-            suggested_follow_ups=[
-                "Can you be more specific? Describe a particular moment.",
-                "Give me the details—what exactly happened in that scene?",
-                "I want to see it through your eyes. Describe it like I haven't seen the film.",
-            ],
+            suggested_follow_ups=LOW_SPECIFICITY_FOLLOW_UPS,
             specificity_score=score,
         )
 
     return VagueAnalysis(
         is_vague=False,
         vagueness_type=None,
-        suggested_follow_ups=[],
+        suggested_follow_ups=(),
         specificity_score=score,
     )
 
@@ -188,43 +257,19 @@ def analyze_response(response: str) -> VagueAnalysis:
 def calculate_specificity_score(response: str) -> float:
     """Calculate a specificity score for a response (0-1)."""
     score = 0.5  # Start at neutral
+    length_bonus = 0.1 * (len(response) > 200) + 0.1 * (len(response) > 400)
 
-    # Positive indicators (increase score)
-    positive_indicators = [
-        (r"\bwhen\b.*\bwas\b", 0.1),  # Temporal specificity
-        (r"\bthe scene where\b", 0.15),  # Scene reference
-        (r"\bspecifically\b", 0.1),
-        (r"\bexactly\b", 0.1),
-        (r"\bi remember\b", 0.1),  # Memory marker
-        (r"\bthe moment\b", 0.1),  # Moment reference
-        (r'"[^"]+?"', 0.15),  # Quoted dialogue
-        (r'\d+', 0.05),  # Numbers (often indicate specificity)
-        (r"\bfirst\b|\bthen\b|\bafter\b|\bbefore\b", 0.1),  # Sequence words
-        (r"\b(face|eyes|hands|voice)\b", 0.1),  # Body/performance details
-        (r"\b(shot|frame|cut|angle)\b", 0.1),  # Technical terms
-    ]
-
-    for pattern, bonus in positive_indicators:
-        if re.search(pattern, response, re.IGNORECASE):
-            score += bonus
-
-    # Negative indicators (decrease score)
-    negative_indicators = [
-        (r"\bkind of\b|\bsort of\b", -0.1),
-        (r"\bi guess\b|\bmaybe\b", -0.1),
-        (r"\bin general\b|\boverall\b", -0.1),
-        (r"\bjust\b.*\breally\b", -0.1),  # Hedging
-    ]
-
-    for pattern, penalty in negative_indicators:
-        if re.search(pattern, response, re.IGNORECASE):
-            score += penalty
+    # Tokenize once; word indicators become set lookups
+    words = set(WORD_REGEX.findall(response.lower()))
+    for i, (triggers, regex, delta) in enumerate(SCORE_INDICATORS):
+        if (triggers and not words.isdisjoint(triggers)) or (regex and regex.search(response)):
+            score += delta
+            # Already saturated: no remaining indicator can pull it below 1.0
+            if score + length_bonus + REMAINING_PENALTY[i] > 1.0 + 1e-9:
+                return 1.0
 
     # Length bonus (longer responses tend to be more specific)
-    if len(response) > 200:
-        score += 0.1
-    if len(response) > 400:
-        score += 0.1
+    score += length_bonus
 
     # Clamp to 0-1
     return max(0.0, min(1.0, score))
@@ -261,28 +306,26 @@ def should_accept_response(analysis: VagueAnalysis, attempt_count: int) -> bool:
 
 
 # Encouragement messages for good responses
-ENCOURAGEMENT_MESSAGES = [
+ENCOURAGEMENT_MESSAGES = (
     "That's exactly the kind of detail that helps.",
     "Good—I can see that scene now.",
     "That specificity is valuable.",
     "This is helpful for understanding your taste.",
-]
+)
 
 # Messages for accepting despite vagueness
-ACCEPTANCE_MESSAGES = [
+ACCEPTANCE_MESSAGES = (
     "I'll note that as you've described it.",
     "Sometimes that's as specific as a feeling gets. Noted.",
     "Let's move on—we can always come back to this.",
-]
+)
 
 
 def get_encouragement() -> str:
     """Get a random encouragement message."""
-    import random
     return random.choice(ENCOURAGEMENT_MESSAGES)
 
 
 def get_acceptance_message() -> str:
     """Get a message for accepting a vague response."""
-    import random
     return random.choice(ACCEPTANCE_MESSAGES)
@@ -10,9 +10,11 @@ from typing import Optional
 import random
 
 
-@dataclass
+@dataclass(frozen=True)
 class MetacognitivePrompt:
     """A metacognitive reflection prompt."""
+    __slots__ = ("key", "text", "timing", "category")
+
     key: str
     text: str
     timing: str  # "before_question", "after_response", "phase_transition", "session_end"
@@ -20,7 +22,7 @@ class MetacognitivePrompt:
 
 
 # Prompts to show BEFORE a question
-BEFORE_QUESTION_PROMPTS = [
+BEFORE_QUESTION_PROMPTS = (
     MetacognitivePrompt(
         key="notice_first",
         text="Before answering, pause for a moment. What comes to mind first?",
@@ -39,10 +41,10 @@ BEFORE_QUESTION_PROMPTS = [
         timing="before_question",
         category="strategy",
     ),
-]
+)
 
 # Prompts to show AFTER a response
-AFTER_RESPONSE_PROMPTS = [
+AFTER_RESPONSE_PROMPTS = (
     MetacognitivePrompt(
         key="new_insight",
         text="Was that something you've thought about before, or did articulating it reveal something new?",
@@ -67,30 +69,30 @@ AFTER_RESPONSE_PROMPTS = [
         timing="after_response",
         category="strategy",
     ),
-]
+)
 
 # Prompts for PHASE TRANSITIONS
 PHASE_TRANSITION_PROMPTS = {
-    "planning_to_monitoring": [
+    "planning_to_monitoring": (
         MetacognitivePrompt(
             key="transition_1",
             text="You've captured your initial impressions. Now let's go deeper into how you actually engaged with the film.",
             timing="phase_transition",
             category="awareness",
         ),
-    ],
-    "monitoring_to_evaluation": [
+    ),
+    "monitoring_to_evaluation": (
         MetacognitivePrompt(
             key="transition_2",
             text="You've explored your experience. Now let's step back and reflect on what it all means.",
             timing="phase_transition",
             category="awareness",
         ),
-    ],
+    ),
 }
 
 # Prompts for SESSION END
-SESSION_END_PROMPTS = [
+SESSION_END_PROMPTS = (
     MetacognitivePrompt(
         key="session_learning",
         text="What did you learn about your taste from this session?",
@@ -109,7 +111,14 @@ SESSION_END_PROMPTS = [
         timing="session_end",
         category="awareness",
     ),
-]
+)
+
+# Prompt pools that get_random_prompt draws from, by timing
+RANDOM_PROMPTS_BY_TIMING = {
+    "before_question": BEFORE_QUESTION_PROMPTS,
+    "after_response": AFTER_RESPONSE_PROMPTS,
+    "session_end": SESSION_END_PROMPTS,
+}
 
 # Confidence calibration scale
 CONFIDENCE_SCALE = {
@@ -123,18 +132,14 @@ CONFIDENCE_SCALE = {
 
 def get_random_prompt(timing: str, exclude_keys: list[str] = None) -> Optional[MetacognitivePrompt]:
     """Get a random metacognitive prompt for a specific timing."""
-    if exclude_keys is None:
-        exclude_keys = []
-
-    if timing == "before_question":
-        prompts = [p for p in BEFORE_QUESTION_PROMPTS if p.key not in exclude_keys]
-    elif timing == "after_response":
-        prompts = [p for p in AFTER_RESPONSE_PROMPTS if p.key not in exclude_keys]
-    elif timing == "session_end":
-        prompts = [p for p in SESSION_END_PROMPTS if p.key not in exclude_keys]
-    else:
+    prompts = RANDOM_PROMPTS_BY_TIMING.get(timing)
+    if prompts is None:
         return None
 
+    if exclude_keys:
+        excluded = set(exclude_keys)
+        prompts = [p for p in prompts if p.key not in excluded]
+
     if prompts:
         return random.choice(prompts)
     return None
@@ -143,7 +148,7 @@ def get_random_prompt(timing: str, exclude_keys: list[str] = None) -> Optional[M
 def get_phase_transition_prompt(from_phase: str, to_phase: str) -> Optional[MetacognitivePrompt]:
     """Get a prompt for transitioning between phases."""
     key = f"{from_phase}_to_{to_phase}"
-    prompts = PHASE_TRANSITION_PROMPTS.get(key, [])
+    prompts = PHASE_TRANSITION_PROMPTS.get(key, ())
     if prompts:
         return prompts[0]
     return None
@@ -155,12 +160,12 @@ def get_confidence_description(level: int) -> str:
 
 
 # Pattern reflection prompts (shown after pattern detection)
-PATTERN_REFLECTION_PROMPTS = [
+PATTERN_REFLECTION_PROMPTS = (
     "You've identified patterns in {count} films now. What surprises you about what you're discovering?",
     "Your responses suggest you value {element}. Does that resonate, or does it feel incomplete?",
     "Three of your favorite moments involved {pattern}. Interesting pattern or coincidence?",
     "I notice you keep mentioning {element}. Is this something you've always known about yourself?",
-]
+)
 
 
 def get_pattern_reflection(count: int = None, element: str = None, pattern: str = None) -> str:
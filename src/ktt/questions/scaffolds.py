@@ -14,9 +14,11 @@ from typing import Optional
 from ktt.questions.bank import Question, get_questions_for_phase
 
 
-@dataclass
+@dataclass(frozen=True)
 class ScaffoldLevel:
     """A scaffolding level with its characteristics."""
+    __slots__ = ("level", "show_hints", "show_examples", "provide_starters", "validate_responses")
+
     level: int  # 1-3, where 1 is heavy and 3 is light
     show_hints: bool
     show_examples: bool
@@ -62,63 +64,63 @@ def get_scaffold_level(session_count: int) -> ScaffoldLevel:
 
 # Sentence starters for heavy scaffolding
 SENTENCE_STARTERS = {
-    "sensory": [
+    "sensory": (
         "The moment that comes to mind is...",
         "I remember seeing...",
         "I can still hear...",
         "What struck me visually was...",
-    ],
-    "emotional": [
+    ),
+    "emotional": (
         "I felt...",
         "It made me...",
         "I was surprised to find myself...",
         "My immediate reaction was...",
-    ],
-    "narrative": [
+    ),
+    "narrative": (
         "The story worked because...",
         "I was drawn in when...",
         "The structure made me...",
         "What kept me watching was...",
-    ],
-    "thematic": [
+    ),
+    "thematic": (
         "This connects to...",
         "I found myself thinking about...",
         "It reminded me of...",
         "What resonated was...",
-    ],
-    "technical": [
+    ),
+    "technical": (
         "I noticed the way...",
         "The [element] made me...",
         "What stood out technically was...",
         "I was aware of...",
-    ],
+    ),
 }
 
 
-def get_sentence_starters(category: str) -> list[str]:
+def get_sentence_starters(category: str) -> tuple[str, ...]:
     """Get sentence starters for a question category."""
-    return SENTENCE_STARTERS.get(category, [])
+    return SENTENCE_STARTERS.get(category, ())
 
 
 # Multiple choice priming questions
 PRIMING_QUESTIONS = {
     "sensory": {
         "prompt": "Was the moment that struck you primarily:",
-        "options": [
+        "options": (
             ("visual", "Something you saw (a shot, a face, a color)"),
             ("auditory", "Something you heard (dialogue, music, silence)"),
             ("kinetic", "Movement or action (choreography, pacing)"),
             ("atmospheric", "A feeling or mood in a scene"),
-        ],
+        ),
     },
     "emotional": {
         "prompt": "Your emotional response was mostly:",
-        "options": [
+        "options": (
             ("visceral", "Physical—tears, laughter, tension"),
             ("contemplative", "Thoughtful—made you reflect"),
             ("nostalgic", "Connected to your own memories"),
             ("unsettling", "Uncomfortable in an interesting way"),
-        ],
+        ),
     },
 }
 
@@ -150,7 +152,10 @@ PHASE_DESCRIPTIONS = {
 
 def get_phase_description(phase: str) -> dict:
     """Get the description for a phase."""
-    return PHASE_DESCRIPTIONS.get(phase, {"name": phase, "description": "", "goal": ""})
+    description = PHASE_DESCRIPTIONS.get(phase)
+    if description is None:
+        return {"name": phase, "description": "", "goal": ""}
+    return description
 
 
 class QuestionSequencer:
@@ -162,6 +167,9 @@ class QuestionSequencer:
         self.current_phase = "planning"
         self.phase_index = 0
         self.phases = ["planning", "monitoring", "evaluation"]
+        # Questions for the current phase, refreshed when the phase advances
+        self._phase_questions = get_questions_for_phase(self.current_phase)
+        self._session_questions: Optional[list[Question]] = None
 
     def get_current_phase(self) -> str:
         """Get the current phase."""
@@ -169,7 +177,7 @@ class QuestionSequencer:
 
     def get_next_question(self) -> Optional[Question]:
         """Get the next question in the sequence."""
-        questions = get_questions_for_phase(self.current_phase)
+        questions = self._phase_questions
 
         if self.phase_index >= len(questions):
             # Move to next phase
@@ -177,7 +185,7 @@ class QuestionSequencer:
             if current_phase_idx < len(self.phases) - 1:
                 self.current_phase = self.phases[current_phase_idx + 1]
                 self.phase_index = 0
-                questions = get_questions_for_phase(self.current_phase)
+                questions = self._phase_questions = get_questions_for_phase(self.current_phase)
             else:
                 return None  # Session complete
 
@@ -190,9 +198,15 @@ class QuestionSequencer:
 
     def get_questions_for_session_type(self) -> list[Question]:
         """Get a curated list of questions based on session type."""
+        if self._session_questions is None:
+            self._session_questions = self._select_session_questions()
+        return list(self._session_questions)
+
+    def _select_session_questions(self) -> list[Question]:
+        """Pick the questions for this session type from the bank."""
         if self.session_type == "deep-dive":
             # Full sequence for one movie
-            return (
+            return list(
                 get_questions_for_phase("planning")[:3] +
                 get_questions_for_phase("monitoring")[:4] +
                 get_questions_for_phase("evaluation")[:4]
@@ -204,17 +218,17 @@ class QuestionSequencer:
                     get_questions_for_phase("monitoring") +
                     get_questions_for_phase("evaluation")
                 )
-                if "compar" in q.text.lower() or "different" in q.text.lower() or "remov" in q.text.lower()
+                if "compar" in q.text_lower or "different" in q.text_lower or "remov" in q.text_lower
             ][:6]
         elif self.session_type == "temporal":
             # Focus on change over time
             return [
                 q for q in get_questions_for_phase("evaluation")
-                if "change" in q.text.lower() or "last" in q.text.lower() or "stay" in q.text.lower()
+                if "change" in q.text_lower or "last" in q.text_lower or "stay" in q.text_lower
             ][:4]
         else:
             # Default: balanced selection
-            return (
+            return list(
                 get_questions_for_phase("planning")[:2] +
                 get_questions_for_phase("monitoring")[:3] +
                 get_questions_for_phase("evaluation")[:3]
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs
 
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
@@ -20,22 +24,91 @@ app = FastAPI(
     description="Discover why you love the movies you love",
 )
 
+# Static URLs stamped with the current asset version can be cached for a year
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@lru_cache(maxsize=1)
+def asset_version() -> str:
+    """Short hash of every static file, so any edit yields new asset URLs."""
+    digest = hashlib.sha256()
+    for path in sorted(STATIC_DIR.rglob("*")):
+        if path.is_file():
+            digest.update(path.relative_to(STATIC_DIR).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+class VersionedStaticFiles(StaticFiles):
+    """Static files that are cached for good when requested with ?v=<asset version>."""
+
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+            if query.get("v") == [asset_version()]:
+                response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            else:
+                response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
 # Mount static files
-app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+app.mount("/static", VersionedStaticFiles(directory=STATIC_DIR), name="static")
 
 # Set up templates
 templates = Jinja2Templates(directory=TEMPLATES_DIR)
 
 
+def _payload(body: bytes) -> tuple[bytes, str]:
+    """Pair a response body with its ETag."""
+    return body, f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def _json_payload(content) -> tuple[bytes, str]:
+    """Serialize content the way JSONResponse does, with an ETag for it."""
+    return _payload(json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8"))
+
+
+def _cached_response(
+    request: Request,
+    payload: tuple[bytes, str],
+    media_type: str = "application/json",
+    cache_control: Optional[str] = None,
+) -> Response:
+    """Serve a prebuilt payload, or 304 if the client already has it."""
+    body, etag = payload
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+@lru_cache(maxsize=1)
+def _index_payload() -> tuple[bytes, str]:
+    """The SPA shell, rendered once; its only input is the asset version."""
+    html = templates.get_template("index.html").render(asset_version=asset_version())
+    return _payload(html.encode("utf-8"))
+
+
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     """Serve the main SPA."""
-    return templates.TemplateResponse("index.html", {"request": request})
+    # Always revalidate the shell so it picks up new asset versions
+    return _cached_response(request, _index_payload(), "text/html", "no-cache")
 
 
-@app.get("/api/questions")
-async def get_questions():
-    """Return the question bank as JSON for the client."""
+@lru_cache(maxsize=1)
+def _questions_payload() -> tuple[bytes, str]:
+    """The question bank as JSON; it never changes while the server runs."""
     from ktt.questions.bank import QUESTIONS_BY_PHASE, Question
 
     def question_to_dict(q: Question) -> dict:
@@ -50,39 +123,53 @@ async def get_questions():
             "requiresSpecificity": q.requires_specificity,
         }
 
-    questions = {
+    return _json_payload({
         phase: [question_to_dict(q) for q in phase_questions]
         for phase, phase_questions in QUESTIONS_BY_PHASE.items()
-    }
+    })
 
-    return JSONResponse(content=questions)
 
-
-@app.get("/api/vague-patterns")
-async def get_vague_patterns():
-    """Return vague response patterns for client-side detection."""
+@lru_cache(maxsize=1)
+def _vague_patterns_payload() -> tuple[bytes, str]:
+    """The vague response patterns as JSON; fixed for the server's lifetime."""
     from ktt.questions.followups import VAGUE_PATTERNS
 
-    patterns = [
+    return _json_payload([
         {
             "pattern": p.pattern,
             "category": p.category,
             "followUps": p.follow_ups,
         }
         for p in VAGUE_PATTERNS
-    ]
+    ])
+
 
-    return JSONResponse(content=patterns)
+@app.get("/api/questions")
+async def get_questions(request: Request):
+    """Return the question bank as JSON for the client."""
+    return _cached_response(request, _questions_payload())
+
+
+@app.get("/api/vague-patterns")
+async def get_vague_patterns(request: Request):
+    """Return vague response patterns for client-side detection."""
+    return _cached_response(request, _vague_patterns_payload())
+
+
+# Printed in one write when the server starts
+STARTUP_BANNER = (
+    "\n  Know Thy Taste - Web Interface\n"
+    "  ================================\n"
+    "  Open http://localhost:8000 in your browser\n"
+    "  Press Ctrl+C to stop\n"
+)
 
 
 def run():
     """Run the web server."""
     import uvicorn
 
-    print("\n  Know Thy Taste - Web Interface")
-    print("  ================================")
-    print("  Open http://localhost:8000 in your browser")
-    print("  Press Ctrl+C to stop\n")
+    print(STARTUP_BANNER, flush=True)
 
     uvicorn.run(
         "ktt.web.app:app",
@@ -0,0 +1,28 @@
+"""Shared fixtures for Know Thy Taste tests."""
+
+import pytest
+
+from ktt.core import database
+from ktt.core.models import Base, User
+from ktt.privacy import consent
+
+
+@pytest.fixture
+def db_user(tmp_path, monkeypatch):
+    """Point the app at a fresh database in a temp dir and create a user."""
+    engine = database.create_db_engine(tmp_path / "ktt.db")
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(database, "_engine", engine)
+    monkeypatch.setattr(database, "_SessionLocal", database.sessionmaker(bind=engine))
+    consent._consent_cache.clear()
+
+    with database.get_session() as db:
+        user = User(password_hash=b"tag", encryption_salt=b"salt", consent_flags={}, settings={})
+        db.add(user)
+        db.flush()
+        db.expunge(user)
+
+    yield user
+
+    consent._consent_cache.clear()
+    engine.dispose()
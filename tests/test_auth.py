@@ -0,0 +1,30 @@
+"""Tests for passphrase verification."""
+
+from types import SimpleNamespace
+
+from ktt.core.auth import hash_passphrase, passphrase_tag, unlock_key, verify_passphrase
+from ktt.core.encryption import derive_key, generate_salt
+
+
+class TestUnlockKey:
+    """Tests for deriving the key from a passphrase."""
+
+    def test_unlocks_with_tag(self):
+        """The stored tag should accept the right passphrase only."""
+        salt = generate_salt()
+        key = derive_key("correct horse 42", salt)
+        user = SimpleNamespace(encryption_salt=salt, password_hash=passphrase_tag(key))
+
+        assert unlock_key("correct horse 42", user) == key
+        assert unlock_key("wrong horse 42", user) is None
+
+    def test_unlocks_legacy_hash(self):
+        """Accounts with the older verification hash should still unlock."""
+        salt = generate_salt()
+        user = SimpleNamespace(
+            encryption_salt=salt,
+            password_hash=hash_passphrase("correct horse 42", salt),
+        )
+
+        assert unlock_key("correct horse 42", user) == derive_key("correct horse 42", salt)
+        assert not verify_passphrase("wrong horse 42", user)
@@ -0,0 +1,57 @@
+"""Tests for consent lookups."""
+
+from ktt.core.database import get_session
+from ktt.core.models import User
+from ktt.privacy import consent
+from ktt.privacy.consent import has_consent, has_consents
+
+
+def set_consent_flags(user, flags):
+    """Write consent flags straight to the database, bypassing the cache."""
+    with get_session() as db:
+        db_user = db.query(User).filter(User.id == user.id).first()
+        db_user.consent_flags = flags
+
+
+class TestHasConsents:
+    """Tests for batched consent checks."""
+
+    def test_reports_each_requested_type(self, db_user):
+        """Every requested type should be present, defaulting to False."""
+        set_consent_flags(db_user, {"enable_export": True})
+
+        assert has_consents(db_user, ["enable_export", "enable_pattern_analysis"]) == {
+            "enable_export": True,
+            "enable_pattern_analysis": False,
+        }
+
+    def test_reuses_recent_read(self, db_user):
+        """Within the TTL a lookup should not see unannounced writes."""
+        set_consent_flags(db_user, {"enable_export": True})
+        assert has_consents(db_user, ["enable_export"]) == {"enable_export": True}
+
+        set_consent_flags(db_user, {})
+        assert has_consents(db_user, ["enable_export"]) == {"enable_export": True}
+
+        consent.forget_consent_flags(db_user.id)
+        assert has_consents(db_user, ["enable_export"]) == {"enable_export": False}
+
+    def test_rereads_after_ttl(self, db_user, monkeypatch):
+        """An expired cache entry should be refreshed from the database."""
+        has_consents(db_user, ["enable_export"])
+        set_consent_flags(db_user, {"enable_export": True})
+
+        monkeypatch.setattr(consent, "CONSENT_CACHE_TTL", 0.0)
+        assert has_consents(db_user, ["enable_export"]) == {"enable_export": True}
+
+    def test_reads_through_open_session(self, db_user):
+        """Passing db should read through that session, seeing its pending writes."""
+        with get_session() as db:
+            db_user_row = db.query(User).filter(User.id == db_user.id).first()
+            db_user_row.consent_flags = {"enable_pattern_analysis": True}
+            db.flush()
+
+            assert has_consents(db_user, ["enable_pattern_analysis"], db=db) == {
+                "enable_pattern_analysis": True,
+            }
+            assert has_consent(db_user, "enable_pattern_analysis", db=db)
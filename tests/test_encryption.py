@@ -1,7 +1,12 @@
 """Tests for encryption utilities."""
 
+import base64
+
 import pytest
+from cryptography.fernet import Fernet
 
+from ktt.analysis.specificity import extract_specific_elements
+from ktt.questions.followups import analyze_response
 from ktt.core.encryption import (
     generate_salt,
     derive_key,
@@ -9,6 +14,8 @@ from ktt.core.encryption import (
     decrypt_string,
     encrypt_json,
     decrypt_json,
+    encrypt_response,
+    decrypt_response,
     set_encryption_key,
     clear_encryption_key,
 )
@@ -67,6 +74,13 @@ class TestEncryption:
         decrypted = decrypt_json(encrypted)
         assert decrypted == original
 
+    def test_long_text_is_compressed(self):
+        """Long plaintexts should round-trip and be stored compressed."""
+        original = "The camera lingers on the empty chair. " * 40
+        encrypted = encrypt_string(original)
+        assert decrypt_string(encrypted) == original
+        assert len(encrypted) < len(original)
+
     def test_encryption_requires_key(self):
         """Encryption should fail without a key set."""
         clear_encryption_key()
@@ -85,3 +99,41 @@ class TestEncryption:
         clear_encryption_key()
         with pytest.raises(RuntimeError):
             decrypt_string(encrypted)
+
+    def test_cached_response_requires_key(self):
+        """Cached response plaintext should not survive clearing the key."""
+        encrypted = encrypt_response("A cached reflection.")
+        assert decrypt_response(encrypted) == "A cached reflection."
+
+        clear_encryption_key()
+        with pytest.raises(RuntimeError):
+            decrypt_response(encrypted)
+
+    def test_clearing_key_drops_analysis_caches(self):
+        """Analysis caches keyed on plaintext should be emptied with the key."""
+        response = "The lighting carried the grief of the family."
+        extract_specific_elements(response)
+        analyze_response(response)
+        assert extract_specific_elements.cache_info().currsize > 0
+        assert analyze_response.cache_info().currsize > 0
+
+        clear_encryption_key()
+        assert extract_specific_elements.cache_info().currsize == 0
+        assert analyze_response.cache_info().currsize == 0
+
+    def test_setting_key_drops_analysis_caches(self):
+        """Switching to another key should not keep the previous user's plaintext."""
+        analyze_response("The lighting carried the grief of the family.")
+
+        set_encryption_key(derive_key("another_passphrase", generate_salt()))
+        assert analyze_response.cache_info().currsize == 0
+
+    def test_decrypts_legacy_fernet_tokens(self):
+        """Data written with the previous Fernet format should still decrypt."""
+        salt = generate_salt()
+        key = derive_key("test_passphrase_123", salt)
+        set_encryption_key(key)
+        legacy = Fernet(base64.urlsafe_b64encode(key)).encrypt(b"An older reflection.")
+
+        assert decrypt_string(legacy) == "An older reflection."
+        assert encrypt_string("A newer reflection.")[:1] != legacy[:1]
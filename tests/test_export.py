@@ -0,0 +1,37 @@
+"""Tests for data export."""
+
+import json
+
+import pytest
+
+from ktt.privacy import export
+
+
+class TestExportJson:
+    """Tests for writing the JSON export."""
+
+    def test_writes_complete_file(self, db_user, tmp_path):
+        """A finished export should be valid JSON with no temp file left over."""
+        output_path = tmp_path / "out.json"
+        assert export.export_json(db_user, output_path) == output_path
+
+        assert json.loads(output_path.read_text())["movies"] == []
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_interrupted_export_leaves_nothing_behind(self, db_user, tmp_path, monkeypatch):
+        """A failed export should not replace the destination or leave a partial file."""
+        export_dir = tmp_path / "exports"
+        export_dir.mkdir()
+        output_path = export_dir / "out.json"
+        output_path.write_text("previous export")
+
+        def interrupted(data, f):
+            f.write('{"movies": [')
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(export, "_write_json_stream", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            export.export_json(db_user, output_path)
+
+        assert output_path.read_text() == "previous export"
+        assert list(export_dir.iterdir()) == [output_path]
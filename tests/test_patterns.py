@@ -0,0 +1,88 @@
+"""Tests for pattern detection scheduling."""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+from ktt.analysis.patterns import (
+    PATTERN_REFRESH_INTERVAL,
+    PATTERN_REFRESH_RESPONSES,
+    patterns_need_refresh,
+)
+from ktt.core.database import get_session
+from ktt.core.models import Movie, Response, Session, User, utcnow
+from ktt.privacy import consent
+
+
+def set_last_detection(user, when):
+    """Record a detection run at the given time."""
+    with get_session() as db:
+        db_user = db.query(User).filter(User.id == user.id).first()
+        db_user.settings = {"last_pattern_detection": when.isoformat()}
+
+
+def add_responses(user, count, created_at):
+    """Add count responses for a new movie, all created at the given time."""
+    with get_session() as db:
+        movie = Movie(user_id=user.id, title="Stalker")
+        session = Session(user_id=user.id, session_type="deep-dive")
+        db.add_all([movie, session])
+        db.flush()
+        db.add_all(
+            Response(
+                session_id=session.id,
+                movie_id=movie.id,
+                question_key="first_memory",
+                question_text="What do you remember?",
+                response_text=b"encrypted",
+                created_at=created_at,
+            )
+            for _ in range(count)
+        )
+
+
+class TestPatternsNeedRefresh:
+    """Tests for deciding when to re-run pattern detection."""
+
+    def test_never_run(self, db_user):
+        """A user who has never had detection run needs it."""
+        assert patterns_need_refresh(db_user)
+
+    def test_no_new_responses(self, db_user):
+        """Nothing new since the last run means no refresh, however old it is."""
+        set_last_detection(db_user, utcnow() - 2 * PATTERN_REFRESH_INTERVAL)
+        assert not patterns_need_refresh(db_user)
+
+    def test_few_recent_responses(self, db_user):
+        """A handful of responses soon after the last run wait for more."""
+        last_run = utcnow() - timedelta(minutes=5)
+        set_last_detection(db_user, last_run)
+        add_responses(db_user, PATTERN_REFRESH_RESPONSES - 1, last_run + timedelta(minutes=1))
+        assert not patterns_need_refresh(db_user)
+
+    def test_enough_new_responses(self, db_user):
+        """Reaching the response threshold triggers a refresh right away."""
+        last_run = utcnow() - timedelta(minutes=5)
+        set_last_detection(db_user, last_run)
+        add_responses(db_user, PATTERN_REFRESH_RESPONSES, last_run + timedelta(minutes=1))
+        assert patterns_need_refresh(db_user)
+
+    def test_interval_elapsed(self, db_user):
+        """Any new response triggers a refresh once the interval has passed."""
+        last_run = utcnow() - PATTERN_REFRESH_INTERVAL - timedelta(minutes=1)
+        set_last_detection(db_user, last_run)
+        add_responses(db_user, 1, last_run + timedelta(minutes=1))
+        assert patterns_need_refresh(db_user)
+
+    def test_withdrawing_consent_resets_schedule(self, db_user, monkeypatch):
+        """Re-granting pattern consent should not wait on the old run's timestamp."""
+        with get_session() as db:
+            db_user_row = db.query(User).filter(User.id == db_user.id).first()
+            db_user_row.consent_flags = {"enable_pattern_analysis": True}
+        set_last_detection(db_user, utcnow())
+        assert not patterns_need_refresh(db_user)
+
+        monkeypatch.setattr(
+            consent.questionary, "confirm", lambda *a, **k: SimpleNamespace(ask=lambda: True)
+        )
+        assert consent.withdraw_consent(db_user, "enable_pattern_analysis")
+        assert patterns_need_refresh(db_user)
@@ -0,0 +1,31 @@
+"""Tests for interactive session helpers."""
+
+from types import SimpleNamespace
+
+import questionary
+
+from ktt.cli import session
+from ktt.cli.session import AUTOCOMPLETE_THRESHOLD, choose_movie
+
+
+class TestChooseMovie:
+    """Tests for picking a movie from a long list."""
+
+    def test_repeated_titles_stay_selectable(self, monkeypatch):
+        """Movies sharing a title should each get their own autocomplete entry."""
+        choices = [questionary.Choice("Solaris (1972)", value="first")]
+        choices += [questionary.Choice("Solaris (1972)", value="second")]
+        choices += [
+            questionary.Choice(f"Movie {i}", value=f"id-{i}")
+            for i in range(AUTOCOMPLETE_THRESHOLD)
+        ]
+        offered = []
+
+        def fake_autocomplete(message, choices, **kwargs):
+            offered.extend(choices)
+            return SimpleNamespace(ask=lambda: "Solaris (1972) [2]")
+
+        monkeypatch.setattr(session.questionary, "autocomplete", fake_autocomplete)
+
+        assert choose_movie("Select movie:", choices) == "second"
+        assert offered[:2] == ["Solaris (1972)", "Solaris (1972) [2]"]
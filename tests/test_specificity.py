@@ -0,0 +1,47 @@
+"""Tests for response specificity scoring."""
+
+import pytest
+
+from ktt.analysis.specificity import (
+    calculate_specificity_score,
+    extract_specific_elements,
+)
+
+
+class TestSpecificityScore:
+    """Tests for specificity scoring."""
+
+    def test_empty_response_scores_zero(self):
+        """Empty or whitespace responses should score zero."""
+        assert calculate_specificity_score("") == 0.0
+        assert calculate_specificity_score("   ") == 0.0
+
+    def test_very_short_response_skips_indicators(self):
+        """Responses under five words get the flat short-response score."""
+        assert calculate_specificity_score("I remember her face.") == pytest.approx(0.3)
+
+    def test_overlapping_indicators_all_count(self):
+        """Indicators spanning the same text should each contribute."""
+        # "when ... was" spans the camera/face terms; all three should count
+        response = "I remember when the camera held on her face and it was quiet. Then more. And more."
+        baseline = "I remember it all and it went quiet. Then more. And more."
+        assert calculate_specificity_score(response) > calculate_specificity_score(baseline)
+
+    def test_repeated_indicator_counts_once(self):
+        """Repeating a single indicator should not keep raising the score."""
+        once = "The shot stayed with me for a long while after it ended."
+        twice = "The shot and the other shot stayed with me for a long while."
+        assert calculate_specificity_score(once) == pytest.approx(calculate_specificity_score(twice))
+
+
+class TestElementExtraction:
+    """Tests for specific element extraction."""
+
+    def test_extracts_technical_and_thematic(self):
+        """Should find both technical elements and themes."""
+        elements = extract_specific_elements("The lighting and the score carried the grief of the family.")
+        assert elements == {"visual", "audio", "theme:loss", "theme:family"}
+
+    def test_no_elements(self):
+        """Responses without known elements should return nothing."""
+        assert extract_specific_elements("It was fine.") == frozenset()
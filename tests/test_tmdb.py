@@ -0,0 +1,118 @@
+"""Tests for the TMDB integration."""
+
+import asyncio
+import os
+import time
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from ktt.integrations import tmdb
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Keep cached responses in a temp dir."""
+    monkeypatch.setattr(tmdb, "get_data_dir", lambda: tmp_path)
+    return tmp_path / tmdb.CACHE_DIR_NAME
+
+
+class TestResponseCache:
+    """Tests for the on-disk response cache."""
+
+    def test_round_trip(self, cache_dir):
+        """A fresh cached response should be served back."""
+        path = tmdb._cache_path("/movie/1", {"api_key": "k"})
+        tmdb._write_cache(path, {"title": "Stalker"})
+        assert tmdb._read_cache(path, timedelta(days=1)) == {"title": "Stalker"}
+
+    def test_stale_entry_is_deleted(self, cache_dir):
+        """Reading an expired response should remove its file."""
+        path = tmdb._cache_path("/movie/1", {})
+        tmdb._write_cache(path, {"title": "Stalker"})
+        old = time.time() - 3600
+        os.utime(path, (old, old))
+
+        assert tmdb._read_cache(path, timedelta(minutes=1)) is None
+        assert not path.exists()
+
+    def test_oldest_entries_are_evicted(self, cache_dir, monkeypatch):
+        """The cache should keep only the most recently written responses."""
+        monkeypatch.setattr(tmdb, "MAX_CACHE_FILES", 3)
+        paths = [tmdb._cache_path(f"/movie/{i}", {}) for i in range(5)]
+        for i, path in enumerate(paths):
+            tmdb._write_cache(path, {"id": i})
+            os.utime(path, (1000 + i, 1000 + i))
+
+        assert sorted(cache_dir.glob("*.json")) == sorted(paths[-3:])
+
+
+@pytest.fixture
+def tmdb_api(cache_dir, monkeypatch):
+    """Serve TMDB requests from canned responses, recording each path."""
+    monkeypatch.setenv("TMDB_API_KEY", "k")
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path == "/3/movie/404":
+            return httpx.Response(404)
+        if request.url.path.endswith("/credits"):
+            return httpx.Response(200, json={
+                "crew": [{"job": "Director", "name": "Andrei Tarkovsky"}],
+                "cast": [{"name": "Alexander Kaidanovsky"}],
+            })
+        return httpx.Response(200, json={
+            "title": "Stalker",
+            "release_date": "1979-05-25",
+            "genres": [{"name": "Drama"}],
+        })
+
+    monkeypatch.setattr(
+        tmdb, "_async_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    return requests
+
+
+class TestEnrichMovies:
+    """Tests for concurrent movie enrichment."""
+
+    def test_merges_details_and_credits(self, tmdb_api):
+        """Each movie should get its details and credits in one dict."""
+        movies = asyncio.run(tmdb.enrich_movies([1, 2]))
+
+        assert set(movies) == {1, 2}
+        assert movies[1]["title"] == "Stalker"
+        assert movies[1]["year"] == 1979
+        assert movies[1]["genres"] == ["Drama"]
+        assert movies[1]["director"] == "Andrei Tarkovsky"
+        assert len(tmdb_api) == 4
+
+    def test_failed_movie_is_left_out(self, tmdb_api):
+        """A movie whose request fails should not hide the others."""
+        movies = asyncio.run(tmdb.enrich_movies([1, 404]))
+        assert set(movies) == {1}
+
+    def test_cached_responses_skip_the_network(self, tmdb_api):
+        """A second lookup should be served from the disk cache."""
+        asyncio.run(tmdb.enrich_movies([1]))
+        asyncio.run(tmdb.enrich_movies([1]))
+        assert len(tmdb_api) == 2
+
+    def test_single_endpoint_helpers(self, tmdb_api):
+        """get_movie_details and get_movie_credits should each make one request."""
+        assert tmdb.get_movie_details(1)["title"] == "Stalker"
+        assert tmdb.get_movie_credits(1) == {
+            "director": "Andrei Tarkovsky",
+            "cast": ["Alexander Kaidanovsky"],
+        }
+        assert tmdb_api == ["/3/movie/1", "/3/movie/1/credits"]
+
+    def test_not_configured(self, cache_dir, monkeypatch):
+        """Without an API key nothing should be fetched."""
+        monkeypatch.delenv("TMDB_API_KEY", raising=False)
+        monkeypatch.setattr(tmdb, "_read_saved_api_key", lambda: None)
+        assert asyncio.run(tmdb.enrich_movies([1])) == {}
+        assert tmdb.get_movie_details(1) is None